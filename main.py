@@ -4,6 +4,8 @@ from src.usuario import Usuario
 from src.conta import Conta
 from src.transacao import Transacao
 from src.categoria import Categoria  # Para exibir/criar/editar categorias
+from src.orcamento import Orcamento
+from src.recorrencia import Recorrencia
 
 
 def criar_usuario(email: str) -> Usuario:
@@ -155,8 +157,10 @@ def cadastrar_despesa(conta: Conta) -> None:
             descricao = input("Digite uma descrição para a despesa: ")
 
             try:
-                conta.inserir_despesa(valor, cat_id, descricao=descricao)
+                aviso = conta.inserir_despesa(valor, cat_id, descricao=descricao)
                 print("Despesa registrada com sucesso!")
+                if aviso:
+                    print(f"Atenção: {aviso}")
             except ValueError as e:
                 print(f"Erro ao registrar despesa: {e}")
             break  # encerra o loop e volta ao menu principal
@@ -169,6 +173,87 @@ def cadastrar_despesa(conta: Conta) -> None:
             print("Opção inválida. Tente novamente.")
 
 
+def definir_orcamento(conta: Conta) -> None:
+    """
+    Define (ou altera) o limite mensal de despesas de uma categoria na conta.
+    """
+    exibir_categorias_existentes()
+    cat_id_str = input("Digite o ID da categoria do orçamento: ")
+    try:
+        cat_id = int(cat_id_str)
+    except ValueError:
+        print("ID inválido.")
+        return
+
+    if not Categoria.buscar_por_id(cat_id):
+        print("Categoria não encontrada.")
+        return
+
+    limite_str = input("Digite o limite mensal: ")
+    try:
+        limite = float(limite_str)
+    except ValueError:
+        print("Valor inválido.")
+        return
+
+    acao = input("Ao exceder o limite (avisar/bloquear) [avisar]: ").strip() or "avisar"
+
+    try:
+        orcamento = Orcamento.buscar(conta.id, cat_id)
+        if orcamento:
+            orcamento.editar(limite=limite, acao=acao)
+        else:
+            Orcamento(conta_id=conta.id, categoria_id=cat_id, limite=limite, acao=acao).salvar()
+        print("Orçamento definido com sucesso!")
+    except ValueError as e:
+        print(f"Erro ao definir orçamento: {e}")
+
+
+def cadastrar_recorrencia(conta: Conta) -> None:
+    """
+    Cadastra uma despesa recorrente (mensal ou semanal) para uma categoria 'fixa'.
+    As ocorrências são lançadas automaticamente ao iniciar o sistema.
+    """
+    exibir_categorias_existentes()
+    cat_id_str = input("Digite o ID da categoria (tipo fixa): ")
+    try:
+        cat_id = int(cat_id_str)
+    except ValueError:
+        print("ID inválido.")
+        return
+
+    valor_str = input("Digite o valor da despesa: ")
+    try:
+        valor = float(valor_str)
+    except ValueError:
+        print("Valor inválido.")
+        return
+
+    descricao = input("Digite uma descrição para a despesa: ")
+    frequencia = input("Frequência (mensal/semanal) [mensal]: ").strip() or "mensal"
+    dia_str = input("Dia do mês (1-31) ou da semana (0=segunda ... 6=domingo) "
+                    "(deixe em branco para usar o dia de hoje): ").strip()
+    try:
+        dia = int(dia_str) if dia_str else None
+    except ValueError:
+        print("Dia inválido.")
+        return
+
+    try:
+        recorrencia = Recorrencia(
+            conta_id=conta.id,
+            categoria_id=cat_id,
+            valor=valor,
+            frequencia=frequencia,
+            dia=dia,
+            descricao=descricao
+        )
+        recorrencia.salvar()
+        print("Despesa recorrente cadastrada com sucesso!")
+    except ValueError as e:
+        print(f"Erro ao cadastrar despesa recorrente: {e}")
+
+
 def menu_usuario(usuario: Usuario):
     """
     Mostra o menu após o usuário ter se autenticado com sucesso.
@@ -184,7 +269,10 @@ def menu_usuario(usuario: Usuario):
         print("1 - Depositar")
         print("2 - Cadastrar Despesa")
         print("3 - Consultar Histórico de Transações")
-        print("4 - Sair")
+        print("4 - Buscar Transações")
+        print("5 - Definir Orçamento de Categoria")
+        print("6 - Cadastrar Despesa Recorrente")
+        print("7 - Sair")
         print("----------------------------")
 
         opcao = input("Escolha uma opção: ")
@@ -224,6 +312,28 @@ def menu_usuario(usuario: Usuario):
                 print("==================================")
 
         elif opcao == "4":
+            consulta = input("Digite o termo de busca (ex.: mercado, aluguel): ")
+            contas_ids = Conta.buscar_por_usuario(usuario.id)['id']
+            df_encontradas = Transacao.buscar_por_texto(consulta, contas_ids)
+            if df_encontradas.empty:
+                print("Nenhuma transação encontrada.")
+            else:
+                print(f"\n==== RESULTADO DA BUSCA: '{consulta}' ====")
+                for _, row in df_encontradas.iterrows():
+                    print(f"ID: {row['id']} | "
+                          f"Tipo: {row['tipo']} | "
+                          f"Valor: R$ {row['valor']:.2f} | "
+                          f"Descrição: {row['descricao']} | "
+                          f"Data: {row['data']}")
+                print("==================================")
+
+        elif opcao == "5":
+            definir_orcamento(conta)
+
+        elif opcao == "6":
+            cadastrar_recorrencia(conta)
+
+        elif opcao == "7":
             print("Saindo do menu...")
             break
 
@@ -234,6 +344,11 @@ def menu_usuario(usuario: Usuario):
 def main():
     print("=== SISTEMA DE CONTROLE FINANCEIRO ===\n")
 
+    # Lança as despesas recorrentes que venceram desde a última execução
+    geradas = Recorrencia.materializar_pendentes()
+    if geradas:
+        print(f"{geradas} despesa(s) recorrente(s) lançada(s).\n")
+
     # Solicita email e senha
     email = input("Insira seu e-mail: ")
     senha = input("Insira sua senha: ")
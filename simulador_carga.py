@@ -0,0 +1,458 @@
+# simulador_carga.py
+"""
+Teste de carga dos fluxos interativos de main.py.
+
+Os fluxos (main, menu_usuario, cadastrar_despesa, editar_categoria) leem o
+teclado com input(). Aqui, input() é substituído por uma versão que consome
+um roteiro de respostas da thread atual, e a saída de cada thread é
+capturada em separado; assim N usuários simulados executam os fluxos reais
+ao mesmo tempo.
+
+Por padrão, cada usuário roda em uma thread do mesmo processo e, portanto,
+todos compartilham as estruturas em memória (CacheConsultas, IndiceBusca,
+GastosMensais, orçamentos carregados): uma gravação de um usuário já
+invalida o cache dos demais. Com --processos, cada usuário roda em um
+processo próprio, como várias instâncias de main.py abertas ao mesmo tempo;
+nesse modo, o cache de cada processo é invalidado pelas gravações dos outros
+ao conferir a data de modificação dos arquivos (ver CacheConsultas.sincronizar).
+
+Os dados são gravados em um diretório temporário (os arquivos de src/data
+não são tocados). Ao final, são exibidos, por ação: latência (p50, p90,
+p99), leituras e escritas de arquivo, erros; a vazão total; e o resultado
+das conferências de consistência dos dados.
+
+Uso:
+    python simulador_carga.py [--usuarios 10] [--acoes 20]
+                              [--mix login=1,deposito=3,despesa=3,historico=2,categoria=1]
+                              [--semente 42] [--processos] [--manter-dados]
+"""
+import argparse
+import builtins
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import main as app
+from src.cache import CacheConsultas
+from src.categoria import Categoria
+from src.conta import Conta
+from src.gastos_mensais import GastosMensais
+from src.indice_busca import IndiceBusca
+from src.orcamento import Orcamento
+from src.recorrencia import Recorrencia
+from src.transacao import Transacao
+from src.usuario import Usuario
+
+MODELOS = [Usuario, Conta, Categoria, Transacao, Orcamento, Recorrencia]
+TABELAS_CONFERIDAS = [Usuario, Conta, Categoria, Transacao]
+ACOES = ['login', 'deposito', 'despesa', 'historico', 'categoria']
+MIX_PADRAO = 'login=1,deposito=3,despesa=3,historico=2,categoria=1'
+OPCAO_SAIR = "7"  # opção "Sair" de menu_usuario
+DEPOSITO_INICIAL = 1000.0
+
+_local = threading.local()
+
+
+# ----------------------------------------------------------------------
+# Instrumentação: entrada roteirizada, saída por thread e contagem de E/S
+# ----------------------------------------------------------------------
+class _SaidaPorThread:
+    """
+    Substitui sys.stdout: o que cada thread imprime vai para o seu próprio buffer.
+    """
+
+    def write(self, texto: str) -> int:
+        buffer = getattr(_local, 'saida', None)
+        if buffer is not None:
+            buffer.append(texto)
+        return len(texto)
+
+    def flush(self) -> None:
+        pass
+
+
+def _entrada_roteirizada(prompt: str = "") -> str:
+    roteiro = getattr(_local, 'roteiro', None)
+    if not roteiro:
+        raise RuntimeError(f"Roteiro esgotado no prompt: {prompt!r}")
+    return roteiro.popleft()
+
+
+def _contar(campo: str) -> None:
+    contadores = getattr(_local, 'contadores', None)
+    if contadores is not None:
+        contadores[campo] += 1
+
+
+class _Instrumentacao:
+    """
+    Instala (e depois remove) a entrada roteirizada, a saída por thread e os
+    contadores de leituras (pd.read_excel) e escritas (DataFrame.to_excel).
+    """
+
+    def __enter__(self):
+        self._input = builtins.input
+        self._stdout = sys.stdout
+        self._read_excel = pd.read_excel
+        self._to_excel = pd.DataFrame.to_excel
+        read_excel, to_excel = self._read_excel, self._to_excel
+
+        def ler(*args, **kwargs):
+            _contar('leituras')
+            return read_excel(*args, **kwargs)
+
+        def gravar(df, *args, **kwargs):
+            _contar('escritas')
+            return to_excel(df, *args, **kwargs)
+
+        builtins.input = _entrada_roteirizada
+        sys.stdout = _SaidaPorThread()
+        pd.read_excel = ler
+        pd.DataFrame.to_excel = gravar
+        return self
+
+    def __exit__(self, *exc):
+        builtins.input = self._input
+        sys.stdout = self._stdout
+        pd.read_excel = self._read_excel
+        pd.DataFrame.to_excel = self._to_excel
+        return False
+
+
+# ----------------------------------------------------------------------
+# Preparação dos dados
+# ----------------------------------------------------------------------
+def _reiniciar_estado_em_memoria() -> None:
+    IndiceBusca.limpar()
+    GastosMensais.limpar()
+    CacheConsultas.limpar()
+    Orcamento.limpar()
+
+
+def _usar_diretorio(diretorio: str) -> dict:
+    """
+    Aponta o DATA_PATH de todos os modelos para `diretorio`.
+    Retorna os caminhos originais, para restauração.
+    """
+    originais = {}
+    for modelo in MODELOS:
+        originais[modelo] = modelo.DATA_PATH
+        modelo.DATA_PATH = os.path.join(diretorio, os.path.basename(modelo.DATA_PATH))
+    _reiniciar_estado_em_memoria()
+    return originais
+
+
+def _preparar_dados(quantidade: int):
+    """
+    Cria as categorias, os usuários e as contas (com um depósito inicial).
+
+    Retorno:
+        tuple: (usuarios, contas, ids das categorias de despesa)
+    """
+    Categoria(nome="Depósito", tipo="variavel").salvar()  # main.py deposita na categoria 1
+    categorias = []
+    for nome, tipo in [("Mercado", "variavel"), ("Aluguel", "fixa"), ("Transporte", "variavel")]:
+        categoria = Categoria(nome=nome, tipo=tipo)
+        categoria.salvar()
+        categorias.append(int(categoria.id))
+
+    usuarios, contas = [], []
+    for i in range(quantidade):
+        usuario = Usuario(nome=f"Usuário {i}", email=f"usuario{i}@carga.teste", senha=f"senha{i}")
+        usuario.salvar()
+        conta = Conta(usuario_id=usuario.id, tipo="corrente")
+        conta.salvar()
+        conta.depositar(DEPOSITO_INICIAL, 1, descricao="Depósito inicial")
+        usuarios.append(usuario)
+        contas.append(conta)
+    return usuarios, contas, categorias
+
+
+# ----------------------------------------------------------------------
+# Ações
+# ----------------------------------------------------------------------
+def _roteiro(acao: str, usuario: Usuario, rng: random.Random, categorias: list):
+    """
+    Monta, para uma ação, a função de main.py a executar, seus argumentos,
+    as respostas que ela vai ler e o valor movimentado (se houver).
+    """
+    valor = round(rng.uniform(1, 50), 2)
+    if acao == 'login':
+        return app.main, (), [usuario.email, usuario.senha, OPCAO_SAIR], 0.0
+    if acao == 'deposito':
+        return app.menu_usuario, (usuario,), ["1", str(valor), OPCAO_SAIR], valor
+    if acao == 'despesa':
+        categoria = str(rng.choice(categorias))
+        return app.cadastrar_despesa, None, ["3", categoria, str(valor), "Compra simulada"], valor
+    if acao == 'historico':
+        return app.menu_usuario, (usuario,), ["3", OPCAO_SAIR], 0.0
+    if acao == 'categoria':
+        categoria = str(rng.choice(categorias))
+        return app.editar_categoria, (), [categoria, f"Categoria {rng.randint(1, 999)}", "", ""], 0.0
+    raise ValueError(f"Ação desconhecida: {acao}")
+
+
+def _sucesso(acao: str, saida: str) -> bool:
+    if acao in ('deposito', 'despesa', 'categoria'):
+        return "sucesso" in saida
+    if acao == 'login':
+        return "autenticado com sucesso" in saida
+    return "HISTÓRICO" in saida or "Não há transações" in saida
+
+
+def _simular_usuario(indice: int, usuario: Usuario, conta: Conta, acoes: int,
+                     pesos: dict, categorias: list, semente: int) -> list:
+    """
+    Executa uma sessão: login seguido de `acoes` ações sorteadas pelo mix.
+    """
+    rng = random.Random(semente + indice)
+    nomes = [a for a in ACOES if pesos.get(a, 0) > 0]
+    sorteadas = ['login'] + rng.choices(nomes, weights=[pesos[a] for a in nomes], k=acoes)
+
+    resultados = []
+    for acao in sorteadas:
+        funcao, argumentos, respostas, valor = _roteiro(acao, usuario, rng, categorias)
+        if argumentos is None:
+            argumentos = (conta,)
+        _local.roteiro = deque(respostas)
+        _local.saida = []
+        _local.contadores = {'leituras': 0, 'escritas': 0}
+        erro = None
+        inicio = time.perf_counter()
+        try:
+            funcao(*argumentos)
+        except Exception as e:  # a falha é o que se quer medir
+            erro = f"{type(e).__name__}: {e}"
+        latencia = time.perf_counter() - inicio
+        saida = ''.join(_local.saida)
+        resultados.append({
+            'usuario': indice,
+            'conta_id': int(conta.id),
+            'acao': acao,
+            'latencia': latencia,
+            'leituras': _local.contadores['leituras'],
+            'escritas': _local.contadores['escritas'],
+            'sucesso': erro is None and _sucesso(acao, saida),
+            'erro': erro,
+            'valor': valor,
+        })
+    _local.roteiro = _local.saida = _local.contadores = None
+    return resultados
+
+
+def _simular_em_processo(diretorio: str, indice: int, usuario: Usuario, conta: Conta, acoes: int,
+                         pesos: dict, categorias: list, semente: int):
+    """
+    Executa uma sessão em um processo próprio (modo --processos), com o
+    estado em memória vazio, como uma nova instância de main.py.
+
+    Retorno:
+        tuple: (resultados da sessão, estatísticas do cache deste processo)
+    """
+    _usar_diretorio(diretorio)
+    with _Instrumentacao():
+        resultados = _simular_usuario(indice, usuario, conta, acoes, pesos, categorias, semente)
+    return resultados, CacheConsultas.estatisticas()
+
+
+def _somar_estatisticas(estatisticas: list) -> dict:
+    """
+    Soma as estatísticas de cache de vários processos.
+    """
+    total = {campo: sum(e[campo] for e in estatisticas) for campo in ('acertos', 'falhas', 'bytes_copiados')}
+    consultas = total['acertos'] + total['falhas']
+    total['taxa_acerto'] = total['acertos'] / consultas if consultas else 0.0
+    return total
+
+
+# ----------------------------------------------------------------------
+# Conferências e relatório
+# ----------------------------------------------------------------------
+def _conferencias_dos_dados() -> list:
+    """
+    Nomes das conferências feitas sobre o conteúdo dos arquivos, na ordem de _conferir().
+    """
+    return [f"IDs únicos em {modelo.__name__}" for modelo in TABELAS_CONFERIDAS] + [
+        "transações com conta existente",
+        "transações com categoria existente",
+        "transações gravadas = depósitos iniciais + operações confirmadas",
+        "saldo de cada conta = operações confirmadas",
+        "nenhum saldo negativo",
+    ]
+
+
+def _conferir(contas: list, resultados: pd.DataFrame) -> list:
+    """
+    Relê os arquivos e confere a consistência dos dados após a simulação.
+    As conferências que dependem dos arquivos são marcadas como puladas
+    (ok=None) se algum deles não puder ser lido.
+
+    Retorno:
+        list: Tuplas (nome da conferência, ok, detalhe).
+    """
+    _reiniciar_estado_em_memoria()
+    conferencias = []
+    try:
+        tabelas = {modelo.__name__: modelo.carregar_todas() for modelo in TABELAS_CONFERIDAS}
+    except Exception as e:
+        conferencias.append(("arquivos legíveis", False, f"{type(e).__name__}: {e}"))
+        return conferencias + [(nome, None, "arquivos ilegíveis") for nome in _conferencias_dos_dados()]
+    conferencias.append(("arquivos legíveis", True, ""))
+
+    for nome, df in tabelas.items():
+        duplicados = int(df['id'].duplicated().sum()) if not df.empty else 0
+        conferencias.append((f"IDs únicos em {nome}", duplicados == 0, f"{duplicados} duplicado(s)"))
+
+    transacoes = tabelas['Transacao']
+    orfas = (~transacoes['conta_id'].isin(tabelas['Conta']['id'])).sum()
+    conferencias.append(("transações com conta existente", orfas == 0, f"{orfas} órfã(s)"))
+    sem_categoria = (~transacoes['categoria_id'].isin(tabelas['Categoria']['id'])).sum()
+    conferencias.append(("transações com categoria existente", sem_categoria == 0, f"{sem_categoria} sem categoria"))
+
+    ok = resultados[resultados['sucesso']]
+    movimentos = ok[ok['acao'].isin(['deposito', 'despesa'])]
+    esperadas = len(contas) + len(movimentos)
+    conferencias.append((
+        "transações gravadas = depósitos iniciais + operações confirmadas",
+        len(transacoes) == esperadas,
+        f"gravadas={len(transacoes)}, esperadas={esperadas}"
+    ))
+
+    sinal = np.where(movimentos['acao'] == 'deposito', 1.0, -1.0)
+    esperado = (movimentos['valor'] * sinal).groupby(movimentos['conta_id']).sum()
+    divergentes, negativos = [], []
+    for conta in contas:
+        saldo = Conta.saldo_da_conta(conta.id)
+        if abs(saldo - (DEPOSITO_INICIAL + esperado.get(int(conta.id), 0.0))) > 0.005:
+            divergentes.append(int(conta.id))
+        if saldo < -0.005:
+            negativos.append(int(conta.id))
+    conferencias.append(("saldo de cada conta = operações confirmadas", not divergentes,
+                         f"contas divergentes: {divergentes}" if divergentes else ""))
+    conferencias.append(("nenhum saldo negativo", not negativos,
+                         f"contas negativas: {negativos}" if negativos else ""))
+    return conferencias
+
+
+def _relatorio(resultados: pd.DataFrame, decorrido: float, conferencias: list, estatisticas: dict,
+               processos: bool) -> None:
+    print("\n==== TESTE DE CARGA ====")
+    if processos:
+        print("Modo: processos (um por usuário; estado em memória separado, como várias instâncias de main.py)")
+    else:
+        print("Modo: threads (um processo; cache, índice de busca e totais em memória compartilhados entre")
+        print("      os usuários, o que não reproduz várias instâncias de main.py; use --processos para isso)")
+    print(f"{'ação':<10} {'qtd':>5} {'erros':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} "
+          f"{'leit./ação':>11} {'escr./ação':>11}")
+    for acao, grupo in resultados.groupby('acao'):
+        ms = grupo['latencia'].to_numpy() * 1000
+        p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+        print(f"{acao:<10} {len(grupo):>5} {(~grupo['sucesso']).sum():>6} {p50:>9.1f} {p90:>9.1f} {p99:>9.1f} "
+              f"{grupo['leituras'].mean():>11.2f} {grupo['escritas'].mean():>11.2f}")
+    print(f"\nTotal: {len(resultados)} ações em {decorrido:.2f}s ({len(resultados) / decorrido:.1f} ações/s)")
+
+    erros = resultados['erro'].dropna()
+    if not erros.empty:
+        print("\nErros mais frequentes:")
+        for mensagem, quantidade in erros.str.slice(0, 100).value_counts().head(5).items():
+            print(f"  {quantidade}x {mensagem}")
+
+    print(f"\nCache: {estatisticas['acertos']} acertos, {estatisticas['falhas']} falhas "
+          f"(taxa de acerto {estatisticas['taxa_acerto']:.0%}); "
+          f"{estatisticas['bytes_copiados'] / 1024:,.0f} KB copiados ao devolver acertos")
+
+    print("\n==== CONSISTÊNCIA ====")
+    for nome, ok, detalhe in conferencias:
+        situacao = 'PULADA' if ok is None else 'OK' if ok else 'FALHA'
+        print(f"[{situacao}] {nome}" + (f" ({detalhe})" if detalhe and not ok else ""))
+
+
+def _ler_mix(texto: str) -> dict:
+    pesos = {}
+    for item in texto.split(','):
+        acao, _, peso = item.partition('=')
+        acao = acao.strip()
+        if acao not in ACOES:
+            raise ValueError(f"Ação desconhecida no mix: {acao!r}. Use: {', '.join(ACOES)}.")
+        pesos[acao] = float(peso)
+    if not any(p > 0 for p in pesos.values()):
+        raise ValueError("O mix deve ter ao menos uma ação com peso positivo.")
+    return pesos
+
+
+def simular(usuarios: int, acoes: int, pesos: dict, semente: int = 42, manter_dados: bool = False,
+            processos: bool = False) -> bool:
+    """
+    Executa a simulação completa e imprime o relatório.
+
+    Parâmetros:
+        processos (bool, opcional): Se True, cada usuário roda em um processo
+            próprio, em vez de em uma thread do processo atual.
+
+    Retorno:
+        bool: True se todas as conferências de consistência passaram.
+    """
+    diretorio = tempfile.mkdtemp(prefix="carga_")
+    originais = _usar_diretorio(diretorio)
+    try:
+        lista_usuarios, contas, categorias = _preparar_dados(usuarios)
+        CacheConsultas.limpar()  # estatísticas apenas da simulação
+
+        inicio = time.perf_counter()
+        if processos:
+            with ProcessPoolExecutor(max_workers=usuarios) as pool:
+                futuros = [
+                    pool.submit(_simular_em_processo, diretorio, i, usuario, conta, acoes, pesos, categorias, semente)
+                    for i, (usuario, conta) in enumerate(zip(lista_usuarios, contas))
+                ]
+                sessoes = [f.result() for f in futuros]
+            resultados = pd.DataFrame([r for sessao, _ in sessoes for r in sessao])
+            estatisticas_cache = _somar_estatisticas([estatisticas for _, estatisticas in sessoes])
+        else:
+            with _Instrumentacao():
+                with ThreadPoolExecutor(max_workers=usuarios) as pool:
+                    futuros = [
+                        pool.submit(_simular_usuario, i, usuario, conta, acoes, pesos, categorias, semente)
+                        for i, (usuario, conta) in enumerate(zip(lista_usuarios, contas))
+                    ]
+                    resultados = pd.DataFrame([r for f in futuros for r in f.result()])
+            estatisticas_cache = CacheConsultas.estatisticas()
+        decorrido = time.perf_counter() - inicio
+
+        conferencias = _conferir(contas, resultados)
+        _relatorio(resultados, decorrido, conferencias, estatisticas_cache, processos)
+        if manter_dados:
+            print(f"\nDados da simulação mantidos em: {diretorio}")
+        return all(ok for _, ok, _ in conferencias)
+    finally:
+        for modelo, caminho in originais.items():
+            modelo.DATA_PATH = caminho
+        _reiniciar_estado_em_memoria()
+        if not manter_dados:
+            shutil.rmtree(diretorio, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga dos fluxos de main.py.")
+    parser.add_argument('--usuarios', type=int, default=10, help="Usuários simulados em paralelo.")
+    parser.add_argument('--acoes', type=int, default=20, help="Ações por usuário (além do login).")
+    parser.add_argument('--mix', default=MIX_PADRAO, help="Pesos das ações, ex.: " + MIX_PADRAO)
+    parser.add_argument('--semente', type=int, default=42, help="Semente do sorteio das ações.")
+    parser.add_argument('--processos', action='store_true',
+                        help="Roda cada usuário em um processo próprio, em vez de em uma thread.")
+    parser.add_argument('--manter-dados', action='store_true', help="Não apaga os arquivos gerados.")
+    args = parser.parse_args()
+
+    ok = simular(args.usuarios, args.acoes, _ler_mix(args.mix), args.semente, args.manter_dados, args.processos)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
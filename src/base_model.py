@@ -1,6 +1,8 @@
 # src/base_model.py
 import pandas as pd
 import os
+from src.cache import CacheConsultas, em_cache
+from src.leitor_xlsx import ler_em_blocos
 
 
 class BaseModel:
@@ -8,16 +10,32 @@ class BaseModel:
     Superclasse que fornece métodos genéricos para carregar dados de um arquivo
     e gerar IDs automaticamente.
 
+    As leituras feitas por carregar_todas() passam pelo CacheConsultas, e toda
+    gravação deve ser feita por _gravar(), que invalida as consultas da tabela.
+    Os métodos que leem, alteram e regravam a tabela (salvar/editar/excluir)
+    devem ler com _ler_arquivo(), que não passa pelo cache.
+
     As classes que herdarem desta classe deverão sobrescrever o atributo de classe DATA_PATH.
     """
     DATA_PATH = None  # Deve ser sobrescrito pelas subclasses
+    TAMANHO_BLOCO = 10_000  # Linhas por bloco em iterar_em_blocos()
 
     @classmethod
+    @em_cache()
     def carregar_todas(cls) -> pd.DataFrame:
         """
         Carrega todos os registros do arquivo Excel em um DataFrame.
         Retorna um DataFrame vazio se o arquivo não existir.
         """
+        return cls._ler_arquivo()
+
+    @classmethod
+    def _ler_arquivo(cls) -> pd.DataFrame:
+        """
+        Versão de carregar_todas() que lê sempre o arquivo, sem passar pelo
+        cache. Usada antes de regravar a tabela, para não sobrescrever
+        alterações feitas no arquivo por outra instância do programa.
+        """
         if cls.DATA_PATH is None:
             raise ValueError("A subclasse deve definir DATA_PATH.")
 
@@ -26,6 +44,28 @@ class BaseModel:
 
         return pd.read_excel(cls.DATA_PATH)
 
+    @classmethod
+    def iterar_em_blocos(cls, tamanho: int = None, inicio: int = 0):
+        """
+        Percorre o arquivo Excel em blocos (DataFrames) de até `tamanho` linhas.
+        Não gera nenhum bloco se o arquivo não existir.
+
+        A planilha e a tabela de textos compartilhados do .xlsx são lidas em
+        fluxo (ver src/leitor_xlsx.py), de modo que a memória usada fica
+        limitada ao tamanho do bloco, e não ao tamanho do arquivo.
+
+        Parâmetros:
+            tamanho (int, opcional): Linhas por bloco. Default é TAMANHO_BLOCO.
+            inicio (int, opcional): Quantidade de linhas de dados a pular.
+        """
+        if cls.DATA_PATH is None:
+            raise ValueError("A subclasse deve definir DATA_PATH.")
+
+        if not os.path.exists(cls.DATA_PATH):
+            return
+
+        yield from ler_em_blocos(cls.DATA_PATH, tamanho or cls.TAMANHO_BLOCO, inicio)
+
     def _generate_id(self) -> int:
         """
         Gera um novo ID com base no arquivo de dados existente, retornando
@@ -34,8 +74,34 @@ class BaseModel:
         if self.DATA_PATH is None:
             raise ValueError("A subclasse deve definir DATA_PATH.")
 
-        if not os.path.exists(self.DATA_PATH):
-            return 1
-
-        df = pd.read_excel(self.DATA_PATH)
+        df = self._ler_arquivo()
         return df['id'].max() + 1 if not df.empty else 1
+
+    @classmethod
+    def _gravar(cls, df: pd.DataFrame) -> None:
+        """
+        Grava o DataFrame no arquivo Excel da tabela e incrementa a sua geração
+        no CacheConsultas, para que nenhuma consulta anterior seja reaproveitada.
+        """
+        if cls.DATA_PATH is None:
+            raise ValueError("A subclasse deve definir DATA_PATH.")
+
+        df.to_excel(cls.DATA_PATH, index=False)
+        CacheConsultas.invalidar(cls.DATA_PATH)
+
+    @classmethod
+    def _reservar_ids(cls, quantidade: int, df: pd.DataFrame = None) -> range:
+        """
+        Reserva um bloco de `quantidade` IDs consecutivos, a partir do maior ID
+        existente. Usado nas gravações em lote, no lugar de uma chamada de
+        _generate_id() por registro.
+
+        Parâmetros:
+            quantidade (int): Número de IDs a reservar.
+            df (pd.DataFrame, opcional): Dados já carregados da tabela, para
+                evitar uma nova leitura do arquivo.
+        """
+        if df is None:
+            df = cls._ler_arquivo()
+        inicio = int(df['id'].max()) + 1 if not df.empty else 1
+        return range(inicio, inicio + quantidade)
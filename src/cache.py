@@ -0,0 +1,238 @@
+# src/cache.py
+import functools
+import os
+import threading
+from collections import OrderedDict
+import pandas as pd
+
+
+class CacheConsultas:
+    """
+    Cache LRU, em memória, para o resultado dos métodos de consulta dos modelos.
+
+    Cada entrada registra as tabelas (identificadas pelo DATA_PATH) de que
+    depende. A cada gravação (ver BaseModel._gravar), invalidar() remove na hora
+    todas as entradas da tabela gravada; assim o cache guarda no máximo uma
+    versão de cada consulta.
+
+    Cada tabela tem também um número de geração, incrementado a cada gravação.
+    Ele faz parte da chave e protege contra uma leitura que começou antes de
+    uma gravação e termina depois dela: esse resultado não é guardado.
+
+    Os arquivos são a fonte da verdade: antes de cada consulta, sincronizar()
+    compara a data de modificação (st_mtime_ns) e o tamanho de cada arquivo com
+    os vistos da última vez. Se outra instância do programa gravou o arquivo,
+    a tabela é invalidada como se a gravação tivesse sido feita aqui.
+
+    OBS: DataFrames são devolvidos como cópia a cada acerto. Em tabelas
+    grandes essa cópia tem custo proporcional ao tamanho da tabela; ele aparece
+    em estatisticas() como 'bytes_copiados'.
+
+    Atributos de classe:
+        tamanho_maximo (int): Número máximo de entradas mantidas.
+    """
+
+    tamanho_maximo: int = 256
+
+    _entradas: OrderedDict = OrderedDict()  # chave -> (valor, tabelas)
+    _por_tabela: dict = {}                  # tabela -> {chaves}
+    _geracoes: dict = {}
+    _assinaturas: dict = {}                 # tabela -> (st_mtime_ns, st_size) vista por último
+    _acertos: int = 0
+    _falhas: int = 0
+    _bytes_copiados: int = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def geracao(cls, tabela: str) -> int:
+        """
+        Retorna a geração atual de uma tabela.
+        """
+        return cls._geracoes.get(tabela, 0)
+
+    @classmethod
+    def invalidar(cls, tabela: str) -> None:
+        """
+        Incrementa a geração de uma tabela e remove as consultas que dependem dela.
+        """
+        assinatura = cls._assinatura(tabela)
+        with cls._lock:
+            cls._assinaturas[tabela] = assinatura
+            cls._invalidar(tabela)
+
+    @classmethod
+    def sincronizar(cls, tabela: str) -> None:
+        """
+        Invalida a tabela se o arquivo foi alterado (por outro processo, por
+        exemplo) desde a última vez em que foi visto.
+        """
+        assinatura = cls._assinatura(tabela)
+        with cls._lock:
+            if tabela in cls._assinaturas and cls._assinaturas[tabela] != assinatura:
+                cls._invalidar(tabela)
+            cls._assinaturas[tabela] = assinatura
+
+    @classmethod
+    def obter(cls, chave):
+        """
+        Retorna (True, valor) se a chave estiver no cache, ou (False, None) caso contrário.
+        """
+        with cls._lock:
+            if chave in cls._entradas:
+                cls._entradas.move_to_end(chave)
+                cls._acertos += 1
+                return True, cls._entradas[chave][0]
+            cls._falhas += 1
+            return False, None
+
+    @classmethod
+    def guardar(cls, chave, valor, tabelas: tuple, geracoes: tuple) -> None:
+        """
+        Guarda um valor no cache, descartando as entradas menos usadas se necessário.
+
+        O valor não é guardado se alguma das `tabelas` foi gravada depois que a
+        consulta começou (isto é, se as gerações atuais diferem de `geracoes`).
+        """
+        with cls._lock:
+            if tuple(cls._geracoes.get(t, 0) for t in tabelas) != geracoes:
+                return
+            cls._entradas[chave] = (valor, tabelas)
+            cls._entradas.move_to_end(chave)
+            for tabela in tabelas:
+                cls._por_tabela.setdefault(tabela, set()).add(chave)
+            while len(cls._entradas) > cls.tamanho_maximo:
+                cls._remover(next(iter(cls._entradas)))
+
+    @classmethod
+    def registrar_copia(cls, quantidade_bytes: int) -> None:
+        """
+        Contabiliza os bytes copiados ao devolver um DataFrame do cache.
+        """
+        with cls._lock:
+            cls._bytes_copiados += quantidade_bytes
+
+    @classmethod
+    def configurar(cls, tamanho_maximo: int) -> None:
+        """
+        Altera o tamanho máximo do cache, descartando as entradas excedentes.
+        """
+        if tamanho_maximo < 1:
+            raise ValueError("O tamanho do cache deve ser positivo.")
+        with cls._lock:
+            cls.tamanho_maximo = tamanho_maximo
+            while len(cls._entradas) > cls.tamanho_maximo:
+                cls._remover(next(iter(cls._entradas)))
+
+    @classmethod
+    def limpar(cls) -> None:
+        """
+        Esvazia o cache e zera as estatísticas.
+        """
+        with cls._lock:
+            cls._entradas.clear()
+            cls._por_tabela.clear()
+            cls._assinaturas.clear()
+            cls._acertos = 0
+            cls._falhas = 0
+            cls._bytes_copiados = 0
+
+    @classmethod
+    def estatisticas(cls) -> dict:
+        """
+        Retorna as estatísticas de uso do cache.
+
+        Retorno:
+            dict: acertos, falhas, taxa_acerto (0 a 1), tamanho, tamanho_maximo
+            e bytes_copiados (total copiado ao devolver DataFrames do cache).
+        """
+        with cls._lock:
+            total = cls._acertos + cls._falhas
+            return {
+                'acertos': cls._acertos,
+                'falhas': cls._falhas,
+                'taxa_acerto': cls._acertos / total if total else 0.0,
+                'tamanho': len(cls._entradas),
+                'tamanho_maximo': cls.tamanho_maximo,
+                'bytes_copiados': cls._bytes_copiados
+            }
+
+    @staticmethod
+    def _assinatura(tabela: str):
+        try:
+            info = os.stat(tabela)
+        except OSError:
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    @classmethod
+    def _invalidar(cls, tabela: str) -> None:
+        # Deve ser chamado com o lock adquirido.
+        cls._geracoes[tabela] = cls._geracoes.get(tabela, 0) + 1
+        for chave in list(cls._por_tabela.pop(tabela, ())):
+            cls._remover(chave)
+
+    @classmethod
+    def _remover(cls, chave) -> None:
+        # Deve ser chamado com o lock adquirido.
+        entrada = cls._entradas.pop(chave, None)
+        if entrada is None:
+            return
+        for tabela in entrada[1]:
+            chaves = cls._por_tabela.get(tabela)
+            if chaves is not None:
+                chaves.discard(chave)
+                if not chaves:
+                    del cls._por_tabela[tabela]
+
+
+def em_cache(*dependencias):
+    """
+    Decorador para métodos de classe de consulta dos modelos.
+
+    O resultado é guardado em CacheConsultas, com chave formada pela classe,
+    pelo nome do método, pelos argumentos e pelas gerações da tabela da própria
+    classe e das tabelas das classes em `dependencias`. Antes de cada chamada,
+    os arquivos dessas tabelas são conferidos (ver CacheConsultas.sincronizar),
+    para que uma alteração feita por outro processo nunca sirva um resultado
+    antigo. Chamadas com argumentos não hasheáveis não são guardadas.
+    DataFrames são devolvidos como cópia, para que o chamador possa alterá-los
+    sem afetar o cache.
+
+    Uso:
+        @classmethod
+        @em_cache(Transacao)
+        def saldo_da_conta(cls, conta_id): ...
+    """
+    def decorador(func):
+        @functools.wraps(func)
+        def envolvida(cls, *args, **kwargs):
+            tabelas = (cls.DATA_PATH,) + tuple(d.DATA_PATH for d in dependencias)
+            for tabela in tabelas:
+                CacheConsultas.sincronizar(tabela)
+            geracoes = tuple(CacheConsultas.geracao(t) for t in tabelas)
+            chave = (
+                cls.__name__,
+                func.__name__,
+                args,
+                tuple(sorted(kwargs.items())),
+                tabelas,
+                geracoes
+            )
+            try:
+                encontrado, valor = CacheConsultas.obter(chave)
+            except TypeError:
+                return func(cls, *args, **kwargs)
+
+            if not encontrado:
+                valor = func(cls, *args, **kwargs)
+                CacheConsultas.guardar(chave, valor, tabelas, geracoes)
+                if isinstance(valor, (pd.DataFrame, pd.Series)):
+                    return valor.copy()
+                return valor
+            if isinstance(valor, (pd.DataFrame, pd.Series)):
+                uso = valor.memory_usage(deep=False)
+                CacheConsultas.registrar_copia(int(uso.sum() if hasattr(uso, 'sum') else uso))
+                return valor.copy()
+            return valor
+        return envolvida
+    return decorador
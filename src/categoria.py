@@ -1,6 +1,7 @@
 # src/categoria.py
 import pandas as pd
 from src.base_model import BaseModel
+from src.indice_busca import IndiceBusca
 
 class Categoria(BaseModel):
     """
@@ -36,7 +37,7 @@ class Categoria(BaseModel):
         """
         Salva os dados da categoria no arquivo Excel, criando-o se não existir.
         """
-        dados_anteriores = self.carregar_todas()  # chama o método herdado
+        dados_anteriores = self._ler_arquivo()  # chama o método herdado
         nova_linha = {
             'id': [self.id],
             'nome': [self.nome],
@@ -45,7 +46,8 @@ class Categoria(BaseModel):
         }
         df_novo = pd.DataFrame(nova_linha)
         df_final = pd.concat([dados_anteriores, df_novo], ignore_index=True)
-        df_final.to_excel(self.DATA_PATH, index=False)
+        self._gravar(df_final)
+        IndiceBusca.registrar_categoria(self.id, self.nome)
 
     @classmethod
     def buscar_por_id(cls, categoria_id: int) -> pd.DataFrame:
@@ -110,7 +112,7 @@ class Categoria(BaseModel):
         Exceções:
             ValueError: Se a categoria não for encontrada ou se o tipo for inválido.
         """
-        df = self.carregar_todas()
+        df = self._ler_arquivo()
         index = df.index[df['id'] == self.id].tolist()
         if not index:
             raise ValueError("Categoria não encontrada.")
@@ -126,7 +128,8 @@ class Categoria(BaseModel):
         if icone is not None:
             df.at[index, 'icone'] = icone
             self.icone = icone
-        df.to_excel(self.DATA_PATH, index=False)
+        self._gravar(df)
+        IndiceBusca.registrar_categoria(self.id, self.nome)
 
     def excluir(self) -> None:
         """
@@ -135,6 +138,7 @@ class Categoria(BaseModel):
         Retorno:
             None: Esta função não retorna valor.
         """
-        df = self.carregar_todas()
+        df = self._ler_arquivo()
         df = df[df['id'] != self.id]
-        df.to_excel(self.DATA_PATH, index=False)
+        self._gravar(df)
+        IndiceBusca.remover_categoria(self.id)
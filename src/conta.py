@@ -5,6 +5,8 @@ import os
 from datetime import datetime
 from src.transacao import Transacao
 from src.base_model import BaseModel
+from src.cache import em_cache
+from src.orcamento import Orcamento
 
 class Conta(BaseModel):
     """
@@ -36,7 +38,7 @@ class Conta(BaseModel):
         Retorno:
             None: Esta função não retorna valor.
         """
-        df_existente = self.carregar_todas()  # método herdado
+        df_existente = self._ler_arquivo()  # método herdado
         dados = {
             'id': [self.id],
             'usuario_id': [self.usuario_id],
@@ -45,7 +47,7 @@ class Conta(BaseModel):
         }
         df_nova = pd.DataFrame(dados)
         df_final = pd.concat([df_existente, df_nova], ignore_index=True)
-        df_final.to_excel(self.DATA_PATH, index=False)
+        self._gravar(df_final)
 
     @classmethod
     def buscar_por_id(cls, conta_id: int):
@@ -77,13 +79,29 @@ class Conta(BaseModel):
         Calcula o saldo da conta somando todas as transações de 'entrada' e
         subtraindo todas as de 'saida'.
         """
+        return self.saldo_da_conta(self.id)
+
+    def get_saldo_em_blocos(self, tamanho: int = None) -> float:
+        """
+        Versão de get_saldo() para históricos maiores que a memória: percorre
+        o arquivo de transações em blocos de `tamanho` linhas.
+        """
+        return Transacao.saldo_em_blocos(self.id, tamanho)
+
+    @classmethod
+    @em_cache(Transacao)
+    def saldo_da_conta(cls, conta_id: int) -> float:
+        """
+        Calcula o saldo de uma conta a partir das suas transações.
+        O resultado fica em cache até a próxima gravação de transações.
+        """
         # Carrega todas as transações
         df_transacoes = Transacao.carregar_todas()
         if df_transacoes.empty:
             return 0.0
 
         # Filtra apenas as transações desta conta
-        df_conta = df_transacoes[df_transacoes['conta_id'] == self.id]
+        df_conta = df_transacoes[df_transacoes['conta_id'] == conta_id]
         if df_conta.empty:
             return 0.0
 
@@ -107,14 +125,22 @@ class Conta(BaseModel):
         )
         transacao.salvar()
 
-    def inserir_despesa(self, valor: float, categoria_id: int, descricao: str = "Despesa") -> None:
+    def inserir_despesa(self, valor: float, categoria_id: int, descricao: str = "Despesa") -> str | None:
         """
         Cria uma transação de 'saida' (despesa).
+
+        Se houver orçamento mensal para a categoria, a despesa é verificada
+        contra ele: orçamentos 'bloquear' impedem o registro (ValueError) e
+        orçamentos 'avisar' apenas retornam uma mensagem de aviso.
+
+        Retorno:
+            str ou None: Aviso de orçamento excedido, se houver.
         """
         if valor <= 0:
             raise ValueError("O valor da despesa deve ser positivo.")
         if valor > self.get_saldo():
             raise ValueError("Saldo insuficiente para registrar essa despesa.")
+        aviso = Orcamento.verificar_despesa(self.id, categoria_id, valor)
 
         transacao = Transacao(
             conta_id=self.id,
@@ -124,3 +150,4 @@ class Conta(BaseModel):
             descricao=descricao
         )
         transacao.salvar()
+        return aviso
@@ -0,0 +1,78 @@
+# src/gastos_mensais.py
+import pandas as pd
+
+
+class GastosMensais:
+    """
+    Totais de despesas do mês corrente (e dos anteriores), acumulados em memória
+    por (conta, categoria, mês).
+
+    Evita recalcular o gasto do mês a partir de todo o histórico a cada despesa:
+    o total é mantido incrementalmente pelos métodos salvar/editar/excluir de
+    Transacao, e a consulta é um acesso direto ao dicionário.
+
+    A estrutura é construída sob demanda (ver `construir`). Enquanto não estiver
+    construída, as atualizações são ignoradas, pois a construção posterior já lê
+    o estado atual do arquivo de transações.
+
+    Atributos de classe:
+        construido (bool): Indica se os totais já foram carregados.
+    """
+
+    construido: bool = False
+    _totais: dict = {}  # (conta_id, categoria_id, 'AAAA-MM') -> valor gasto
+
+    @staticmethod
+    def mes_de(data) -> str:
+        """
+        Retorna o mês ('AAAA-MM') de uma data em string ou datetime.
+        """
+        return str(data)[:7]
+
+    @classmethod
+    def construir(cls, df_transacoes: pd.DataFrame) -> None:
+        """
+        (Re)constrói os totais a partir do DataFrame de transações, de forma vetorizada.
+        """
+        cls._totais = {}
+        if not df_transacoes.empty:
+            saidas = df_transacoes[df_transacoes['tipo'] == 'saida']
+            if not saidas.empty:
+                # Mesma regra de mes_de(), usada por registrar(): não depende do formato da data
+                meses = saidas['data'].astype(str).str[:7]
+                totais = saidas.groupby([saidas['conta_id'], saidas['categoria_id'], meses])['valor'].sum()
+                cls._totais = {
+                    (int(conta_id), int(categoria_id), mes): float(valor)
+                    for (conta_id, categoria_id, mes), valor in totais.items()
+                }
+        cls.construido = True
+
+    @classmethod
+    def limpar(cls) -> None:
+        """
+        Descarta os totais; eles serão reconstruídos na próxima consulta.
+        """
+        cls.construido = False
+        cls._totais = {}
+
+    @classmethod
+    def registrar(cls, conta_id: int, categoria_id: int, tipo: str, valor: float, data, sinal: int = 1) -> None:
+        """
+        Soma (sinal=1) ou subtrai (sinal=-1) uma transação dos totais.
+        Transações de 'entrada' são ignoradas.
+        """
+        if not cls.construido or tipo != 'saida':
+            return
+        chave = (int(conta_id), int(categoria_id), cls.mes_de(data))
+        total = cls._totais.get(chave, 0.0) + sinal * float(valor)
+        if abs(total) < 1e-9:
+            cls._totais.pop(chave, None)
+        else:
+            cls._totais[chave] = total
+
+    @classmethod
+    def total(cls, conta_id: int, categoria_id: int, mes: str) -> float:
+        """
+        Retorna o total gasto por uma conta em uma categoria no mês informado ('AAAA-MM').
+        """
+        return cls._totais.get((int(conta_id), int(categoria_id), mes), 0.0)
@@ -0,0 +1,298 @@
+# src/indice_busca.py
+import bisect
+import re
+import unicodedata
+import pandas as pd
+
+
+class IndiceBusca:
+    """
+    Índice invertido, mantido em memória, sobre a descrição das transações e
+    o nome das categorias.
+
+    O texto é normalizado (minúsculas, sem acentos) e quebrado em termos. Cada
+    termo aponta para o conjunto de IDs de transações que o contêm, e os termos
+    ficam também numa lista ordenada para permitir buscas por prefixo com bisect.
+
+    O índice guarda também os campos de exibição de cada transação (ver
+    COLUNAS_TRANSACAO), para que o resultado de uma busca seja montado sem
+    reler o histórico.
+
+    O índice é construído sob demanda na primeira busca (ver `construir`) e, a
+    partir daí, atualizado incrementalmente pelos métodos salvar/editar/excluir
+    de Transacao e Categoria. Enquanto não estiver construído, as atualizações
+    são ignoradas, pois a construção posterior já lê o estado atual dos arquivos.
+
+    Atributos de classe:
+        construido (bool): Indica se o índice já foi carregado.
+        STOPWORDS (set): Palavras muito comuns em português que não são indexadas.
+    """
+
+    STOPWORDS = {
+        'a', 'o', 'as', 'os', 'e', 'de', 'da', 'do', 'das', 'dos', 'em', 'no', 'na',
+        'nos', 'nas', 'um', 'uma', 'para', 'por', 'com', 'via'
+    }
+    COLUNAS_TRANSACAO = ['id', 'conta_id', 'categoria_id', 'tipo', 'valor', 'descricao', 'data']
+
+    construido: bool = False
+    _termos_transacao: dict = {}    # termo -> {id da transação}
+    _termos_categoria: dict = {}    # termo -> {id da categoria}
+    _vocabulario: list = []         # termos ordenados (transações e categorias)
+    _transacoes: dict = {}          # id da transação -> (conta_id, categoria_id, termos, linha)
+    _por_categoria: dict = {}       # id da categoria -> {id da transação}
+    _por_conta: dict = {}           # id da conta -> {id da transação}
+    _categorias: dict = {}          # id da categoria -> termos do nome
+
+    @staticmethod
+    def normalizar(texto) -> str:
+        """
+        Converte o texto para minúsculas e remove os acentos.
+        """
+        if texto is None or (not isinstance(texto, str) and pd.isna(texto)):
+            return ""
+        decomposto = unicodedata.normalize('NFKD', str(texto).lower())
+        return ''.join(c for c in decomposto if not unicodedata.combining(c))
+
+    @classmethod
+    def tokenizar(cls, texto) -> set:
+        """
+        Retorna o conjunto de termos indexáveis de um texto.
+        """
+        termos = re.findall(r'\w+', cls.normalizar(texto))
+        return {t for t in termos if t not in cls.STOPWORDS}
+
+    @classmethod
+    def construir(cls, df_transacoes: pd.DataFrame, df_categorias: pd.DataFrame) -> None:
+        """
+        (Re)constrói o índice a partir dos DataFrames de transações e categorias.
+        """
+        cls._termos_transacao = {}
+        cls._termos_categoria = {}
+        cls._vocabulario = []
+        cls._transacoes = {}
+        cls._por_categoria = {}
+        cls._por_conta = {}
+        cls._categorias = {}
+
+        if not df_categorias.empty:
+            for cat_id, nome in zip(df_categorias['id'], df_categorias['nome']):
+                cls._adicionar_categoria(int(cat_id), nome)
+
+        if not df_transacoes.empty:
+            linhas = zip(*(df_transacoes[c] for c in cls.COLUNAS_TRANSACAO))
+            for transacao_id, conta_id, categoria_id, tipo, valor, descricao, data in linhas:
+                cls._adicionar_transacao(
+                    int(transacao_id), int(conta_id), int(categoria_id), descricao, tipo, valor, data
+                )
+
+        cls.construido = True
+
+    @classmethod
+    def limpar(cls) -> None:
+        """
+        Descarta o índice; ele será reconstruído na próxima busca.
+        """
+        cls.construido = False
+        cls._termos_transacao = {}
+        cls._termos_categoria = {}
+        cls._vocabulario = []
+        cls._transacoes = {}
+        cls._por_categoria = {}
+        cls._por_conta = {}
+        cls._categorias = {}
+
+    # ------------------------------------------------------------------
+    # Atualizações incrementais
+    # ------------------------------------------------------------------
+    @classmethod
+    def registrar_transacao(cls, transacao_id: int, conta_id: int, categoria_id: int, descricao,
+                            tipo: str, valor: float, data) -> None:
+        """
+        Insere (ou substitui) uma transação no índice.
+        """
+        if not cls.construido:
+            return
+        cls._remover_transacao(int(transacao_id))
+        cls._adicionar_transacao(int(transacao_id), int(conta_id), int(categoria_id), descricao, tipo, valor, data)
+
+    @classmethod
+    def remover_transacao(cls, transacao_id: int) -> None:
+        """
+        Remove uma transação do índice.
+        """
+        if not cls.construido:
+            return
+        cls._remover_transacao(int(transacao_id))
+
+    @classmethod
+    def registrar_categoria(cls, categoria_id: int, nome: str) -> None:
+        """
+        Insere (ou substitui) o nome de uma categoria no índice.
+        """
+        if not cls.construido:
+            return
+        cls._remover_categoria(int(categoria_id))
+        cls._adicionar_categoria(int(categoria_id), nome)
+
+    @classmethod
+    def remover_categoria(cls, categoria_id: int) -> None:
+        """
+        Remove o nome de uma categoria do índice.
+        """
+        if not cls.construido:
+            return
+        cls._remover_categoria(int(categoria_id))
+
+    # ------------------------------------------------------------------
+    # Busca
+    # ------------------------------------------------------------------
+    @classmethod
+    def buscar(cls, consulta: str, conta_ids=None) -> set:
+        """
+        Retorna os IDs das transações que contêm todos os termos da consulta.
+
+        Cada termo é tratado como prefixo e casa tanto com a descrição da
+        transação quanto com o nome da sua categoria.
+
+        Parâmetros:
+            consulta (str): Texto da busca (ex.: "merc jan").
+            conta_ids (iterável, opcional): Restringe o resultado a estas contas.
+
+        Retorno:
+            set: IDs das transações encontradas.
+        """
+        termos = cls.tokenizar(consulta)
+        if not termos:
+            return set()
+
+        # Os candidatos vêm da fonte mais seletiva: os postings do termo mais raro
+        # ou as transações das contas informadas. Os demais critérios apenas
+        # filtram os candidatos, sem unir os postings de termos muito frequentes.
+        postings = {termo: cls._buscar_prefixo(termo) for termo in termos}
+        tamanhos = {termo: sum(len(c) for c in conjuntos) for termo, conjuntos in postings.items()}
+        mais_raro = min(tamanhos, key=tamanhos.get)
+
+        contas = None if conta_ids is None else {int(c) for c in conta_ids}
+        por_conta = [cls._por_conta[c] for c in contas or () if c in cls._por_conta]
+        if contas is not None and sum(len(c) for c in por_conta) <= tamanhos[mais_raro]:
+            resultado = set().union(*por_conta)
+            pendentes = termos
+        else:
+            resultado = set().union(*postings[mais_raro])
+            if contas is not None:
+                resultado = {t for t in resultado if cls._transacoes[t][0] in contas}
+            pendentes = termos - {mais_raro}
+
+        for termo in pendentes:
+            if not resultado:
+                break
+            conjuntos = postings[termo]
+            if len(conjuntos) <= 8:
+                resultado = {t for t in resultado if any(t in c for c in conjuntos)}
+            else:  # prefixo curto, que casa com muitos termos: confere a própria transação
+                resultado = {t for t in resultado if cls._casa(t, termo)}
+        return resultado
+
+    @classmethod
+    def linhas(cls, transacao_ids) -> pd.DataFrame:
+        """
+        Monta, a partir dos campos guardados no índice, o DataFrame das
+        transações informadas (ordenadas por ID), com as colunas COLUNAS_TRANSACAO.
+        """
+        registros = [cls._transacoes[t][3] for t in sorted(transacao_ids) if t in cls._transacoes]
+        return pd.DataFrame(registros, columns=cls.COLUNAS_TRANSACAO)
+
+    @classmethod
+    def _casa(cls, transacao_id: int, prefixo: str) -> bool:
+        """
+        Indica se a descrição ou a categoria da transação tem um termo com o prefixo.
+        """
+        _, categoria_id, termos, _ = cls._transacoes[transacao_id]
+        if any(t.startswith(prefixo) for t in termos):
+            return True
+        return any(t.startswith(prefixo) for t in cls._categorias.get(categoria_id, ()))
+
+    @classmethod
+    def _buscar_prefixo(cls, prefixo: str) -> list:
+        """
+        Retorna os conjuntos de IDs de transações (sem uni-los) de todos os
+        termos que começam com `prefixo`, pela descrição ou pela categoria.
+        """
+        conjuntos = []
+        vocabulario = cls._vocabulario
+        for posicao in range(bisect.bisect_left(vocabulario, prefixo), len(vocabulario)):
+            termo = vocabulario[posicao]
+            if not termo.startswith(prefixo):
+                break
+            if termo in cls._termos_transacao:
+                conjuntos.append(cls._termos_transacao[termo])
+            for categoria_id in cls._termos_categoria.get(termo, ()):
+                if categoria_id in cls._por_categoria:
+                    conjuntos.append(cls._por_categoria[categoria_id])
+        return conjuntos
+
+    # ------------------------------------------------------------------
+    # Auxiliares internos
+    # ------------------------------------------------------------------
+    @classmethod
+    def _registrar_termo(cls, termo: str) -> None:
+        if termo not in cls._termos_transacao and termo not in cls._termos_categoria:
+            bisect.insort(cls._vocabulario, termo)
+
+    @classmethod
+    def _descartar_termo(cls, termo: str) -> None:
+        if termo not in cls._termos_transacao and termo not in cls._termos_categoria:
+            posicao = bisect.bisect_left(cls._vocabulario, termo)
+            if posicao < len(cls._vocabulario) and cls._vocabulario[posicao] == termo:
+                del cls._vocabulario[posicao]
+
+    @classmethod
+    def _adicionar_transacao(cls, transacao_id: int, conta_id: int, categoria_id: int, descricao,
+                             tipo: str, valor: float, data) -> None:
+        termos = cls.tokenizar(descricao)
+        linha = (transacao_id, conta_id, categoria_id, tipo, valor, descricao, data)
+        cls._transacoes[transacao_id] = (conta_id, categoria_id, termos, linha)
+        cls._por_categoria.setdefault(categoria_id, set()).add(transacao_id)
+        cls._por_conta.setdefault(conta_id, set()).add(transacao_id)
+        for termo in termos:
+            cls._registrar_termo(termo)
+            cls._termos_transacao.setdefault(termo, set()).add(transacao_id)
+
+    @classmethod
+    def _remover_transacao(cls, transacao_id: int) -> None:
+        registro = cls._transacoes.pop(transacao_id, None)
+        if registro is None:
+            return
+        conta_id, categoria_id, termos, _ = registro
+        cls._por_categoria.get(categoria_id, set()).discard(transacao_id)
+        cls._por_conta.get(conta_id, set()).discard(transacao_id)
+        for termo in termos:
+            ids = cls._termos_transacao.get(termo)
+            if ids is None:
+                continue
+            ids.discard(transacao_id)
+            if not ids:
+                del cls._termos_transacao[termo]
+                cls._descartar_termo(termo)
+
+    @classmethod
+    def _adicionar_categoria(cls, categoria_id: int, nome) -> None:
+        termos = cls.tokenizar(nome)
+        cls._categorias[categoria_id] = termos
+        for termo in termos:
+            cls._registrar_termo(termo)
+            cls._termos_categoria.setdefault(termo, set()).add(categoria_id)
+
+    @classmethod
+    def _remover_categoria(cls, categoria_id: int) -> None:
+        termos = cls._categorias.pop(categoria_id, None)
+        if termos is None:
+            return
+        for termo in termos:
+            ids = cls._termos_categoria.get(termo)
+            if ids is None:
+                continue
+            ids.discard(categoria_id)
+            if not ids:
+                del cls._termos_categoria[termo]
+                cls._descartar_termo(termo)
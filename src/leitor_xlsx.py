@@ -0,0 +1,319 @@
+# src/leitor_xlsx.py
+"""
+Leitura de arquivos .xlsx em blocos, com memória limitada ao tamanho do bloco.
+
+O openpyxl, mesmo em modo somente leitura, carrega a tabela de textos
+compartilhados (xl/sharedStrings.xml) inteira na memória; como descrições e
+datas são quase todas distintas, essa tabela cresce com o arquivo. Aqui a
+planilha e a tabela de textos são lidas em fluxo (iterparse): se a tabela for
+pequena, fica numa lista; se for grande, é copiada para um SQLite temporário
+em disco e consultada bloco a bloco.
+
+Células numéricas com formato de data ou hora (xl/styles.xml) e células do
+tipo data ISO (t="d") são convertidas em datetime/time, como no pd.read_excel;
+assim planilhas abertas e salvas no Excel são lidas corretamente.
+"""
+import os
+import posixpath
+import re
+import sqlite3
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, time, timedelta
+import pandas as pd
+
+_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# Tabelas de textos (descompactadas) até este tamanho ficam em memória.
+LIMITE_TEXTOS_EM_MEMORIA = 1024 * 1024
+_LOTE_CONSULTA = 900  # parâmetros por consulta ao SQLite
+
+# Formatos numéricos embutidos do Excel que representam data ou hora
+_FORMATOS_DATA_EMBUTIDOS = {14, 15, 16, 17, 22}
+_FORMATOS_HORA_EMBUTIDOS = {18, 19, 20, 21, 45, 46, 47}
+_ORIGEM_1900 = datetime(1899, 12, 30)
+_ORIGEM_1904 = datetime(1904, 1, 1)
+
+
+class _IndiceTexto(int):
+    """Índice de um texto compartilhado, ainda não resolvido."""
+
+
+def _caminho_primeira_planilha(arquivo: zipfile.ZipFile) -> str:
+    livro = ET.fromstring(arquivo.read('xl/workbook.xml'))
+    planilha = livro.find(f'{_NS}sheets/{_NS}sheet')
+    rel_id = planilha.get(f'{_NS_REL}id')
+    relacoes = ET.fromstring(arquivo.read('xl/_rels/workbook.xml.rels'))
+    for relacao in relacoes.iter(f'{_NS_PKG}Relationship'):
+        if relacao.get('Id') == rel_id:
+            alvo = relacao.get('Target')
+            if alvo.startswith('/'):
+                return alvo.lstrip('/')
+            return posixpath.normpath(posixpath.join('xl', alvo))
+    raise ValueError("Planilha não encontrada no arquivo.")
+
+
+def _usa_1904(arquivo: zipfile.ZipFile) -> bool:
+    propriedades = ET.fromstring(arquivo.read('xl/workbook.xml')).find(f'{_NS}workbookPr')
+    return propriedades is not None and propriedades.get('date1904') in ('1', 'true')
+
+
+def _classificar_formato(codigo: str):
+    """
+    Retorna 'data', 'hora' ou None para um código de formato numérico.
+    """
+    # Ignora textos entre aspas, caracteres escapados e seções como [Red] ou [$-416]
+    codigo = re.sub(r'"[^"]*"|\\.|\[[^\]]*\]', '', codigo.split(';')[0]).lower()
+    if re.search(r'[dy]', codigo) or (re.search(r'm', codigo) and not re.search(r'[hs]', codigo)):
+        return 'data'
+    if re.search(r'[hs]', codigo):
+        return 'hora'
+    return None
+
+
+def _estilos_de_data(arquivo: zipfile.ZipFile) -> dict:
+    """
+    Lê xl/styles.xml e retorna {índice do estilo (atributo s da célula): 'data' ou 'hora'}
+    para os estilos cujo formato numérico é de data ou de hora.
+    """
+    if 'xl/styles.xml' not in arquivo.namelist():
+        return {}
+    estilos = ET.fromstring(arquivo.read('xl/styles.xml'))
+    personalizados = {
+        int(formato.get('numFmtId')): _classificar_formato(formato.get('formatCode', ''))
+        for formato in estilos.iter(f'{_NS}numFmt')
+    }
+    resultado = {}
+    celulas = estilos.find(f'{_NS}cellXfs')
+    for indice, xf in enumerate(celulas if celulas is not None else ()):
+        formato = int(xf.get('numFmtId', 0))
+        if formato in personalizados:
+            classe = personalizados[formato]
+        elif formato in _FORMATOS_HORA_EMBUTIDOS:
+            classe = 'hora'
+        elif formato in _FORMATOS_DATA_EMBUTIDOS:
+            classe = 'data'
+        else:
+            classe = None
+        if classe:
+            resultado[indice] = classe
+    return resultado
+
+
+def _de_serial(numero: float, classe: str, origem: datetime):
+    """
+    Converte um número serial do Excel em datetime (ou time, para formatos só de hora).
+    """
+    if origem is _ORIGEM_1900 and 1 <= numero < 60:
+        numero += 1  # o Excel considera 29/02/1900, que não existe
+    momento = origem + timedelta(days=numero)
+    # Arredonda ao milissegundo, descartando o erro de ponto flutuante do serial
+    momento = pd.Timestamp(momento).round('ms').to_pydatetime()
+    if classe == 'hora' and 0 <= numero < 1:
+        return momento.time()
+    return momento
+
+
+def _de_iso(texto: str):
+    """
+    Converte o valor de uma célula t="d" (ISO 8601) em datetime, date ou time.
+    """
+    if 'T' in texto:
+        return pd.Timestamp(texto).to_pydatetime()
+    if ':' in texto:
+        return time.fromisoformat(texto)
+    return date.fromisoformat(texto)
+
+
+def _textos(arquivo: zipfile.ZipFile):
+    """
+    Percorre xl/sharedStrings.xml em fluxo, gerando cada texto na ordem do índice.
+    """
+    if 'xl/sharedStrings.xml' not in arquivo.namelist():
+        return
+    with arquivo.open('xl/sharedStrings.xml') as fluxo:
+        raiz = None
+        for evento, elemento in ET.iterparse(fluxo, events=('start', 'end')):
+            if evento == 'start':
+                if raiz is None:
+                    raiz = elemento
+                continue
+            if elemento.tag == f'{_NS}si':
+                # Texto simples (<t>) ou rico (<r><t>); ignora a fonética (<rPh>).
+                partes = [t.text or '' for t in elemento.iter(f'{_NS}t')]
+                for fonetica in elemento.iter(f'{_NS}rPh'):
+                    for t in fonetica.iter(f'{_NS}t'):
+                        partes.remove(t.text or '')
+                yield ''.join(partes)
+                # Descarta os textos já lidos, para que a árvore não cresça.
+                raiz.clear()
+
+
+class _TabelaTextos:
+    """
+    Tabela de textos compartilhados: em memória se for pequena, ou num
+    SQLite temporário em disco se for grande.
+    """
+
+    def __init__(self, arquivo: zipfile.ZipFile):
+        self._lista = None
+        self._conn = None
+        self._caminho = None
+        try:
+            tamanho = arquivo.getinfo('xl/sharedStrings.xml').file_size
+        except KeyError:
+            tamanho = 0
+
+        if tamanho <= LIMITE_TEXTOS_EM_MEMORIA:
+            self._lista = list(_textos(arquivo))
+            return
+
+        descritor, self._caminho = tempfile.mkstemp(suffix='.db')
+        os.close(descritor)
+        self._conn = sqlite3.connect(self._caminho)
+        self._conn.execute("CREATE TABLE textos (indice INTEGER PRIMARY KEY, texto TEXT)")
+        lote = []
+        for indice, texto in enumerate(_textos(arquivo)):
+            lote.append((indice, texto))
+            if len(lote) == 10_000:
+                self._conn.executemany("INSERT INTO textos VALUES (?, ?)", lote)
+                lote = []
+        self._conn.executemany("INSERT INTO textos VALUES (?, ?)", lote)
+        self._conn.commit()
+
+    def resolver(self, indices: set) -> dict:
+        """
+        Retorna {índice: texto} para os índices informados.
+        """
+        if self._lista is not None:
+            return {i: self._lista[i] for i in indices}
+        resultado = {}
+        indices = list(indices)
+        for inicio in range(0, len(indices), _LOTE_CONSULTA):
+            lote = indices[inicio:inicio + _LOTE_CONSULTA]
+            marcadores = ', '.join('?' for _ in lote)
+            resultado.update(self._conn.execute(
+                f"SELECT indice, texto FROM textos WHERE indice IN ({marcadores})", lote
+            ))
+        return resultado
+
+    def fechar(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            os.remove(self._caminho)
+
+
+def _coluna(referencia: str) -> int:
+    """Converte a referência da célula (ex.: 'C12') no índice da coluna (base 0)."""
+    numero = 0
+    for caractere in referencia:
+        if not caractere.isalpha():
+            break
+        numero = numero * 26 + (ord(caractere.upper()) - 64)
+    return numero - 1
+
+
+def _valor(celula, estilos: dict, origem: datetime):
+    tipo = celula.get('t', 'n')
+    if tipo == 'inlineStr':
+        if celula.find(f'{_NS}is') is None:
+            return None
+        return ''.join(t.text or '' for t in celula.iter(f'{_NS}t'))
+    v = celula.find(f'{_NS}v')
+    if v is None or v.text is None:
+        return None
+    if tipo == 's':
+        return _IndiceTexto(int(v.text))
+    if tipo in ('str', 'e'):
+        return v.text
+    if tipo == 'b':
+        return v.text == '1'
+    if tipo == 'd':
+        return _de_iso(v.text)
+    texto = v.text
+    classe = estilos.get(int(celula.get('s', 0)))
+    if classe:
+        return _de_serial(float(texto), classe, origem)
+    if any(c in texto for c in '.eE'):
+        numero = float(texto)
+        return int(numero) if numero.is_integer() and 'E' not in texto and 'e' not in texto else numero
+    return int(texto)
+
+
+def _linhas(arquivo: zipfile.ZipFile, caminho_planilha: str):
+    """
+    Percorre a planilha em fluxo, gerando cada linha como lista de valores
+    (textos compartilhados ainda como _IndiceTexto).
+    """
+    estilos = _estilos_de_data(arquivo)
+    origem = _ORIGEM_1904 if _usa_1904(arquivo) else _ORIGEM_1900
+    with arquivo.open(caminho_planilha) as fluxo:
+        dados = None
+        for evento, elemento in ET.iterparse(fluxo, events=('start', 'end')):
+            if evento == 'start':
+                if elemento.tag == f'{_NS}sheetData':
+                    dados = elemento
+                continue
+            if elemento.tag != f'{_NS}row':
+                continue
+            linha = []
+            for posicao, celula in enumerate(elemento.iter(f'{_NS}c')):
+                referencia = celula.get('r')
+                coluna = _coluna(referencia) if referencia else posicao
+                while len(linha) < coluna:
+                    linha.append(None)
+                linha.append(_valor(celula, estilos, origem))
+            yield linha
+            # Descarta as linhas já lidas, para que a árvore não cresça.
+            elemento.clear()
+            if dados is not None:
+                dados.clear()
+
+
+def _resolver(linhas: list, textos: _TabelaTextos) -> list:
+    indices = {v for linha in linhas for v in linha if isinstance(v, _IndiceTexto)}
+    if not indices:
+        return linhas
+    mapa = textos.resolver(indices)
+    return [[mapa[v] if isinstance(v, _IndiceTexto) else v for v in linha] for linha in linhas]
+
+
+def ler_em_blocos(caminho: str, tamanho: int, inicio: int = 0):
+    """
+    Lê a primeira planilha de um arquivo .xlsx em DataFrames de até `tamanho`
+    linhas, usando a primeira linha como cabeçalho e pulando as `inicio`
+    primeiras linhas de dados. Linhas totalmente vazias são ignoradas.
+
+    A memória usada é limitada pelo tamanho do bloco (e, para tabelas de
+    textos pequenas, por LIMITE_TEXTOS_EM_MEMORIA), qualquer que seja o
+    tamanho do arquivo.
+    """
+    with zipfile.ZipFile(caminho) as arquivo:
+        textos = _TabelaTextos(arquivo)
+        try:
+            linhas = _linhas(arquivo, _caminho_primeira_planilha(arquivo))
+            cabecalho = next(linhas, None)
+            if cabecalho is None:
+                return
+            cabecalho = _resolver([cabecalho], textos)[0]
+            largura = len(cabecalho)
+
+            bloco = []
+            pular = inicio
+            for linha in linhas:
+                if all(v is None for v in linha):
+                    continue
+                if pular:
+                    pular -= 1
+                    continue
+                bloco.append((linha + [None] * largura)[:largura])
+                if len(bloco) == tamanho:
+                    yield pd.DataFrame(_resolver(bloco, textos), columns=cabecalho)
+                    bloco = []
+            if bloco:
+                yield pd.DataFrame(_resolver(bloco, textos), columns=cabecalho)
+        finally:
+            textos.fechar()
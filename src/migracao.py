@@ -0,0 +1,411 @@
+# src/migracao.py
+"""
+Migração dos arquivos Excel (src/data/*.xlsx) para um banco SQLite.
+
+Cada tabela é lida em blocos (BaseModel.iterar_em_blocos), os tipos
+são normalizados e os blocos são gravados no banco. O progresso de cada
+tabela é gravado na mesma transação de cada bloco, de modo que uma migração
+interrompida continua de onde parou ao ser executada novamente.
+
+Cada tabela é criada com "id" INTEGER PRIMARY KEY e com os índices de
+INDICES, usados pelas consultas dos modelos (ex.: transações por conta).
+
+Ao final, o banco é conferido contra os arquivos de origem: quantidade de
+linhas, conjunto de IDs e intervalo das datas de cada tabela, e saldo de cada conta. Os IDs da
+origem são copiados, bloco a bloco, para uma tabela temporária e comparados
+no próprio SQLite (EXCEPT), sem montar os conjuntos em memória.
+
+As colunas de domínio fechado validado pelos modelos (ver DOMINIOS) são
+gravadas como TEXT com uma restrição CHECK, de modo que o banco preserva o
+domínio da categoria. As demais colunas categóricas ('tipo' de contas e de
+categorias, que aceitam texto livre) são category apenas em memória, no
+DataFrame devolvido por normalizar_tipos(); no banco são TEXT simples.
+
+Uso (a partir da raiz do projeto):
+    python -m src.migracao [--destino src/data/minha_carteira.db]
+                           [--tamanho-bloco 5000] [--reiniciar] [--apenas-verificar]
+"""
+import argparse
+import numbers
+import os
+import sqlite3
+import time
+import pandas as pd
+from src.usuario import Usuario
+from src.conta import Conta
+from src.categoria import Categoria
+from src.transacao import Transacao
+from src.orcamento import Orcamento
+from src.recorrencia import Recorrencia
+
+DESTINO_PADRAO = 'src/data/minha_carteira.db'
+TAMANHO_BLOCO_PADRAO = 5000
+
+# Nome da tabela no banco -> modelo de origem
+TABELAS = {
+    'usuarios': Usuario,
+    'contas': Conta,
+    'categorias': Categoria,
+    'transacoes': Transacao,
+    'orcamentos': Orcamento,
+    'recorrencias': Recorrencia,
+}
+
+COLUNAS_DATA = {'data', 'data_cadastro', 'data_criacao', 'data_inicio', 'ultima_execucao'}
+COLUNAS_CATEGORICAS = {'tipo', 'acao', 'frequencia'}
+
+# (tabela, coluna) -> valores permitidos, para as colunas cujo domínio os modelos validam
+DOMINIOS = {
+    ('transacoes', 'tipo'): ('entrada', 'saida'),
+    ('orcamentos', 'acao'): tuple(Orcamento.ACOES),
+    ('recorrencias', 'frequencia'): tuple(Recorrencia.FREQUENCIAS),
+}
+
+# Tabela -> colunas indexadas (um índice por tupla)
+INDICES = {
+    'contas': [('usuario_id',)],
+    'transacoes': [('conta_id',)],
+    'orcamentos': [('conta_id', 'categoria_id')],
+    'recorrencias': [('conta_id',)],
+}
+
+ORIGEM_SERIAL_EXCEL = '1899-12-30'
+FORMATO_DATA_SQL = '%Y-%m-%d %H:%M:%S'
+
+
+def _converter_datas(serie: pd.Series) -> pd.Series:
+    """
+    Converte uma coluna de datas em datetime. Textos devem estar em ISO 8601
+    ('AAAA-MM-DD' ou 'AAAA-MM-DD HH:MM:SS'); números são tratados como datas
+    seriais do Excel (dias desde 30/12/1899).
+
+    Exceções:
+        ValueError: Se algum texto não for uma data ISO 8601.
+    """
+    numericos = serie.map(lambda v: isinstance(v, numbers.Real) and not isinstance(v, bool) and not pd.isna(v))
+    numericos = numericos.astype(bool)
+    datas = pd.to_datetime(serie.where(~numericos), format='ISO8601')
+    if numericos.any():
+        seriais = pd.to_datetime(
+            pd.to_numeric(serie[numericos]), unit='D', origin=ORIGEM_SERIAL_EXCEL
+        ).dt.round('ms')
+        datas = datas.astype(seriais.dtype)
+        datas[numericos] = seriais
+    return datas
+
+
+def normalizar_tipos(df: pd.DataFrame, tabela: str = None) -> pd.DataFrame:
+    """
+    Normaliza os tipos de um bloco: IDs como int64 (Int64 se houver nulos),
+    datas como datetime, colunas de domínio fechado ('tipo', 'acao',
+    'frequencia') como category e valores monetários como float64.
+
+    Se `tabela` for informada, as colunas com domínio em DOMINIOS recebem
+    exatamente essas categorias.
+
+    Exceções:
+        ValueError: Se uma coluna com domínio tiver um valor fora dele.
+    """
+    df = df.copy()
+    for coluna in df.columns:
+        if coluna == 'id' or coluna.endswith('_id'):
+            # IDs opcionais (ex.: recorrencia_id de lançamentos manuais) ficam como Int64, que aceita nulos
+            numeros = pd.to_numeric(df[coluna])
+            df[coluna] = numeros.astype('Int64' if numeros.isna().any() else 'int64')
+        elif coluna in COLUNAS_DATA:
+            df[coluna] = _converter_datas(df[coluna])
+        elif (tabela, coluna) in DOMINIOS:
+            dominio = DOMINIOS[(tabela, coluna)]
+            invalidos = set(df[coluna].dropna()) - set(dominio)
+            if invalidos:
+                raise ValueError(f"[{tabela}] valores inválidos em '{coluna}': {sorted(map(str, invalidos))}")
+            df[coluna] = df[coluna].astype(pd.CategoricalDtype(dominio))
+        elif coluna in COLUNAS_CATEGORICAS:
+            df[coluna] = df[coluna].astype('category')
+        elif coluna in ('valor', 'limite', 'saldo'):
+            df[coluna] = pd.to_numeric(df[coluna]).astype('float64')
+    return df
+
+
+def _definicao_coluna(tabela: str, coluna: str, serie: pd.Series) -> str:
+    if coluna == 'id':
+        return '"id" INTEGER PRIMARY KEY'
+    definicao = f'"{coluna}" {_tipo_sql(serie)}'
+    if (tabela, coluna) in DOMINIOS:
+        valores = ', '.join(f"'{v}'" for v in DOMINIOS[(tabela, coluna)])
+        definicao += f' CHECK ("{coluna}" IN ({valores}))'
+    return definicao
+
+
+def _tipo_sql(serie: pd.Series) -> str:
+    if pd.api.types.is_integer_dtype(serie):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(serie):
+        return 'REAL'
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return 'TIMESTAMP'
+    return 'TEXT'
+
+
+def _para_registros(df: pd.DataFrame) -> list:
+    """
+    Converte um bloco normalizado em tuplas aceitas pelo sqlite3.
+    """
+    df = df.copy()
+    for coluna in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[coluna]):
+            df[coluna] = df[coluna].dt.strftime(FORMATO_DATA_SQL)
+    df = df.astype(object).where(df.notna(), None)
+    return list(df.itertuples(index=False, name=None))
+
+
+def _preparar_banco(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS _migracao ("
+        "tabela TEXT PRIMARY KEY, linhas INTEGER NOT NULL, concluida INTEGER NOT NULL)"
+    )
+    conn.commit()
+
+
+def _progresso(conn: sqlite3.Connection, tabela: str):
+    linha = conn.execute(
+        "SELECT linhas, concluida FROM _migracao WHERE tabela = ?", (tabela,)
+    ).fetchone()
+    return (0, False) if linha is None else (linha[0], bool(linha[1]))
+
+
+def migrar_tabela(conn: sqlite3.Connection, tabela: str, modelo, tamanho_bloco: int) -> int:
+    """
+    Migra uma tabela, em blocos, retomando a partir do último bloco gravado.
+
+    Retorno:
+        int: Quantidade de linhas migradas nesta execução.
+    """
+    ja_migradas, concluida = _progresso(conn, tabela)
+    if concluida:
+        print(f"[{tabela}] já migrada ({ja_migradas} linhas).")
+        return 0
+    if ja_migradas:
+        print(f"[{tabela}] retomando a partir da linha {ja_migradas}.")
+
+    inicio = time.perf_counter()
+    migradas = 0
+    for bloco in modelo.iterar_em_blocos(tamanho_bloco, inicio=ja_migradas):
+        bloco = normalizar_tipos(bloco, tabela)
+        colunas = ', '.join(f'"{c}"' for c in bloco.columns)
+        marcadores = ', '.join('?' for _ in bloco.columns)
+        with conn:  # bloco e progresso na mesma transação
+            definicao = ', '.join(_definicao_coluna(tabela, c, bloco[c]) for c in bloco.columns)
+            conn.execute(f'CREATE TABLE IF NOT EXISTS "{tabela}" ({definicao})')
+            for colunas_indice in INDICES.get(tabela, []):
+                nome = f'idx_{tabela}_' + '_'.join(colunas_indice)
+                lista = ', '.join(f'"{c}"' for c in colunas_indice)
+                conn.execute(f'CREATE INDEX IF NOT EXISTS "{nome}" ON "{tabela}" ({lista})')
+            conn.executemany(
+                f'INSERT INTO "{tabela}" ({colunas}) VALUES ({marcadores})', _para_registros(bloco)
+            )
+            migradas += len(bloco)
+            conn.execute(
+                "INSERT OR REPLACE INTO _migracao (tabela, linhas, concluida) VALUES (?, ?, 0)",
+                (tabela, ja_migradas + migradas)
+            )
+        decorrido = time.perf_counter() - inicio
+        print(f"[{tabela}] {ja_migradas + migradas} linhas "
+              f"({migradas / decorrido:,.0f} linhas/s)")
+
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO _migracao (tabela, linhas, concluida) VALUES (?, ?, 1)",
+            (tabela, ja_migradas + migradas)
+        )
+    decorrido = time.perf_counter() - inicio
+    taxa = migradas / decorrido if decorrido else 0.0
+    print(f"[{tabela}] concluída: {migradas} linhas em {decorrido:.2f}s ({taxa:,.0f} linhas/s)")
+    return migradas
+
+
+def _saldos_da_origem(tamanho_bloco: int) -> dict:
+    saldos = {}
+    for bloco in Transacao.iterar_em_blocos(tamanho_bloco):
+        bloco = normalizar_tipos(bloco, 'transacoes')
+        sinal = bloco['tipo'].map({'entrada': 1.0, 'saida': -1.0}).astype('float64').fillna(0.0)
+        parciais = (bloco['valor'] * sinal).groupby(bloco['conta_id']).sum()
+        for conta_id, valor in parciais.items():
+            saldos[int(conta_id)] = saldos.get(int(conta_id), 0.0) + float(valor)
+    return {conta_id: round(valor, 2) for conta_id, valor in saldos.items()}
+
+
+def _resumir_datas(resumo: dict, bloco: pd.DataFrame) -> None:
+    """
+    Acumula, para cada coluna de data do bloco, (quantidade não nula, mínima, máxima).
+    """
+    for coluna in COLUNAS_DATA.intersection(bloco.columns):
+        datas = _converter_datas(bloco[coluna]).dropna()
+        if datas.empty:
+            resumo.setdefault(coluna, (0, None, None))
+            continue
+        quantidade, minima, maxima = resumo.get(coluna, (0, None, None))
+        menor, maior = datas.min().strftime(FORMATO_DATA_SQL), datas.max().strftime(FORMATO_DATA_SQL)
+        resumo[coluna] = (
+            quantidade + len(datas),
+            menor if minima is None else min(minima, menor),
+            maior if maxima is None else max(maxima, maior),
+        )
+
+
+def _comparar_tabela(conn: sqlite3.Connection, tabela: str, modelo, tamanho_bloco: int):
+    """
+    Copia os IDs da origem, bloco a bloco, para uma tabela temporária e os
+    compara com os do destino no próprio SQLite. No mesmo passo, resume as
+    colunas de data da origem (ver _resumir_datas).
+
+    Retorno:
+        tuple: (linhas na origem, linhas no destino, IDs faltando, IDs sobrando,
+        resumo das datas na origem).
+    """
+    conn.execute("DROP TABLE IF EXISTS temp._ids_origem")
+    conn.execute("CREATE TEMP TABLE _ids_origem (id INTEGER)")
+    try:
+        linhas_origem = 0
+        datas_origem = {}
+        for bloco in modelo.iterar_em_blocos(tamanho_bloco):
+            conn.executemany(
+                "INSERT INTO temp._ids_origem (id) VALUES (?)",
+                ((int(i),) for i in bloco['id'])
+            )
+            _resumir_datas(datas_origem, bloco)
+            linhas_origem += len(bloco)
+
+        try:
+            linhas_destino = conn.execute(f'SELECT COUNT(*) FROM "{tabela}"').fetchone()[0]
+            faltando = conn.execute(
+                f'SELECT COUNT(*) FROM (SELECT id FROM temp._ids_origem EXCEPT SELECT id FROM "{tabela}")'
+            ).fetchone()[0]
+            sobrando = conn.execute(
+                f'SELECT COUNT(*) FROM (SELECT id FROM "{tabela}" EXCEPT SELECT id FROM temp._ids_origem)'
+            ).fetchone()[0]
+        except sqlite3.OperationalError:  # tabela ainda não criada no destino
+            linhas_destino, sobrando = 0, 0
+            faltando = conn.execute(
+                "SELECT COUNT(DISTINCT id) FROM temp._ids_origem"
+            ).fetchone()[0]
+        return linhas_origem, linhas_destino, faltando, sobrando, datas_origem
+    finally:
+        conn.execute("DROP TABLE temp._ids_origem")
+        conn.commit()
+
+
+def verificar(conn: sqlite3.Connection, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> list:
+    """
+    Confere o banco contra os arquivos de origem: quantidade de linhas,
+    conjunto de IDs e, para cada coluna de data, quantidade de datas
+    preenchidas, data mínima e máxima de cada tabela; e saldo de cada conta.
+
+    Retorno:
+        list: Mensagens descrevendo as divergências (vazia se tudo confere).
+    """
+    divergencias = []
+    for tabela, modelo in TABELAS.items():
+        if not os.path.exists(modelo.DATA_PATH):
+            continue
+        linhas_origem, linhas_destino, faltando, sobrando, datas_origem = _comparar_tabela(
+            conn, tabela, modelo, tamanho_bloco
+        )
+        if linhas_origem != linhas_destino:
+            divergencias.append(f"[{tabela}] linhas: origem={linhas_origem}, destino={linhas_destino}")
+        if faltando or sobrando:
+            divergencias.append(f"[{tabela}] IDs: {faltando} faltando, {sobrando} sobrando")
+        for coluna, origem in sorted(datas_origem.items()):
+            try:
+                destino = conn.execute(
+                    f'SELECT COUNT("{coluna}"), MIN("{coluna}"), MAX("{coluna}") FROM "{tabela}"'
+                ).fetchone()
+            except sqlite3.OperationalError:
+                destino = (0, None, None)
+            if tuple(origem) != tuple(destino):
+                divergencias.append(
+                    f"[{tabela}] datas em '{coluna}' (quantidade, mínima, máxima): origem={origem}, destino={destino}"
+                )
+
+    if os.path.exists(Transacao.DATA_PATH):
+        saldos_origem = _saldos_da_origem(tamanho_bloco)
+        consulta = (
+            "SELECT conta_id, SUM(CASE tipo WHEN 'entrada' THEN valor "
+            "WHEN 'saida' THEN -valor ELSE 0 END) FROM transacoes GROUP BY conta_id"
+        )
+        try:
+            saldos_destino = {int(c): round(v, 2) for c, v in conn.execute(consulta)}
+        except sqlite3.OperationalError:
+            saldos_destino = {}
+        for conta_id in sorted(set(saldos_origem) | set(saldos_destino)):
+            origem = saldos_origem.get(conta_id)
+            destino = saldos_destino.get(conta_id)
+            if origem is None or destino is None or abs(origem - destino) > 0.005:
+                divergencias.append(f"[transacoes] saldo da conta {conta_id}: origem={origem}, destino={destino}")
+    return divergencias
+
+
+def migrar(destino: str = DESTINO_PADRAO, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+           reiniciar: bool = False) -> bool:
+    """
+    Migra todas as tabelas existentes para o banco `destino` e confere o resultado.
+
+    Retorno:
+        bool: True se a conferência não encontrou divergências.
+    """
+    if reiniciar and os.path.exists(destino):
+        os.remove(destino)
+
+    conn = sqlite3.connect(destino)
+    try:
+        _preparar_banco(conn)
+        inicio = time.perf_counter()
+        total = 0
+        for tabela, modelo in TABELAS.items():
+            if not os.path.exists(modelo.DATA_PATH):
+                print(f"[{tabela}] arquivo {modelo.DATA_PATH} não encontrado; ignorada.")
+                continue
+            total += migrar_tabela(conn, tabela, modelo, tamanho_bloco)
+        decorrido = time.perf_counter() - inicio
+        print(f"Migração: {total} linhas em {decorrido:.2f}s")
+
+        print("Conferindo o banco contra os arquivos de origem...")
+        return _relatar(verificar(conn, tamanho_bloco))
+    finally:
+        conn.close()
+
+
+def _relatar(divergencias: list) -> bool:
+    if divergencias:
+        print("Conferência FALHOU:")
+        for mensagem in divergencias:
+            print(f"  - {mensagem}")
+        return False
+    print("Conferência OK: linhas, IDs, datas e saldos conferem.")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migra os dados dos arquivos Excel para SQLite.")
+    parser.add_argument('--destino', default=DESTINO_PADRAO, help="Caminho do banco SQLite.")
+    parser.add_argument('--tamanho-bloco', type=int, default=TAMANHO_BLOCO_PADRAO,
+                        help="Linhas lidas e gravadas por bloco.")
+    parser.add_argument('--reiniciar', action='store_true',
+                        help="Apaga o banco de destino e recomeça a migração do zero.")
+    parser.add_argument('--apenas-verificar', action='store_true',
+                        help="Apenas confere um banco já migrado.")
+    args = parser.parse_args()
+
+    if args.apenas_verificar:
+        conn = sqlite3.connect(args.destino)
+        try:
+            ok = _relatar(verificar(conn, args.tamanho_bloco))
+        finally:
+            conn.close()
+    else:
+        ok = migrar(args.destino, args.tamanho_bloco, args.reiniciar)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+# src/orcamento.py
+import pandas as pd
+from datetime import datetime
+from src.base_model import BaseModel
+from src.transacao import Transacao
+from src.gastos_mensais import GastosMensais
+
+
+class Orcamento(BaseModel):
+    """
+    Classe responsável por representar e manipular o orçamento mensal de uma
+    categoria em uma conta.
+
+    Atributos:
+        DATA_PATH (str): Caminho para o arquivo Excel onde os orçamentos são salvos.
+        id (int): Identificador único do orçamento.
+        conta_id (int): Identificador da conta à qual o orçamento pertence.
+        categoria_id (int): Identificador da categoria limitada pelo orçamento.
+        limite (float): Valor máximo de despesas da categoria em um mês.
+        acao (str): O que fazer ao estourar o limite: 'avisar' ou 'bloquear'.
+
+    Parâmetros do construtor:
+        conta_id (int): ID da conta.
+        categoria_id (int): ID da categoria.
+        limite (float): Limite mensal de despesas.
+        acao (str, opcional): 'avisar' ou 'bloquear'. Default é 'avisar'.
+        id (int, opcional): Identificador único. Se None, será gerado automaticamente.
+
+    OBS: Os orçamentos ficam também em memória, indexados por (conta, categoria),
+    e o gasto do mês vem de GastosMensais; assim a verificação de uma despesa
+    não precisa reler o histórico de transações.
+    """
+
+    DATA_PATH = 'src/data/orcamentos.xlsx'
+    ACOES = ['avisar', 'bloquear']
+
+    _carregados: bool = False
+    _limites: dict = {}  # (conta_id, categoria_id) -> (limite, acao)
+
+    def __init__(self, conta_id: int, categoria_id: int, limite: float, acao: str = 'avisar', id: int = None):
+        self.id: int = id or self._generate_id()
+        self.conta_id: int = conta_id
+        self.categoria_id: int = categoria_id
+        self.limite: float = limite
+        self.acao: str = acao  # 'avisar' ou 'bloquear'
+
+    def salvar(self) -> None:
+        """
+        Salva os dados do orçamento no arquivo Excel, criando-o se não existir.
+
+        Exceções:
+            ValueError: Se o limite não for positivo, se a ação for inválida ou
+            se já existir um orçamento para a mesma conta e categoria.
+        """
+        self._validar(self.limite, self.acao)
+        if self.buscar(self.conta_id, self.categoria_id):
+            raise ValueError("Já existe um orçamento para essa categoria nesta conta.")
+
+        dados_anteriores = self._ler_arquivo()
+        nova_linha = {
+            'id': [self.id],
+            'conta_id': [self.conta_id],
+            'categoria_id': [self.categoria_id],
+            'limite': [self.limite],
+            'acao': [self.acao]
+        }
+        df_novo = pd.DataFrame(nova_linha)
+        df_final = pd.concat([dados_anteriores, df_novo], ignore_index=True)
+        self._gravar(df_final)
+        Orcamento._limites[(int(self.conta_id), int(self.categoria_id))] = (float(self.limite), self.acao)
+
+    @classmethod
+    def buscar(cls, conta_id: int, categoria_id: int):
+        """
+        Busca o orçamento de uma categoria em uma conta.
+
+        Retorno:
+            Orcamento ou None: Retorna uma instância de Orcamento se encontrado;
+            caso contrário, retorna None.
+        """
+        df = cls.carregar_todas()
+        if df.empty:
+            return None
+        orcamento = df[(df['conta_id'] == conta_id) & (df['categoria_id'] == categoria_id)]
+        if not orcamento.empty:
+            o = orcamento.iloc[0]
+            return cls(
+                id=o['id'],
+                conta_id=o['conta_id'],
+                categoria_id=o['categoria_id'],
+                limite=o['limite'],
+                acao=o['acao']
+            )
+        return None
+
+    def editar(self, limite: float = None, acao: str = None) -> None:
+        """
+        Edita o limite e/ou a ação do orçamento e atualiza o arquivo Excel.
+
+        Exceções:
+            ValueError: Se o orçamento não for encontrado ou se os valores forem inválidos.
+        """
+        self._validar(self.limite if limite is None else limite, acao or self.acao)
+        df = self._ler_arquivo()
+        index = df.index[df['id'] == self.id].tolist() if not df.empty else []
+        if not index:
+            raise ValueError("Orçamento não encontrado.")
+        index = index[0]
+        if limite is not None:
+            df.at[index, 'limite'] = limite
+            self.limite = limite
+        if acao:
+            df.at[index, 'acao'] = acao
+            self.acao = acao
+        self._gravar(df)
+        Orcamento._limites[(int(self.conta_id), int(self.categoria_id))] = (float(self.limite), self.acao)
+
+    def excluir(self) -> None:
+        """
+        Exclui o orçamento do arquivo Excel.
+        """
+        df = self._ler_arquivo()
+        if not df.empty:
+            df = df[df['id'] != self.id]
+        self._gravar(df)
+        Orcamento._limites.pop((int(self.conta_id), int(self.categoria_id)), None)
+
+    @classmethod
+    def verificar_despesa(cls, conta_id: int, categoria_id: int, valor: float, data: str = None) -> str | None:
+        """
+        Verifica se uma nova despesa estoura o orçamento mensal da categoria.
+
+        Parâmetros:
+            conta_id (int): ID da conta.
+            categoria_id (int): ID da categoria da despesa.
+            valor (float): Valor da nova despesa.
+            data (str, opcional): Data da despesa. Se None, usa o mês atual.
+
+        Retorno:
+            str ou None: Mensagem de aviso se o orçamento 'avisar' for estourado;
+            None se a despesa couber no orçamento ou se não houver orçamento.
+
+        Exceções:
+            ValueError: Se o orçamento for do tipo 'bloquear' e a despesa o estourar.
+        """
+        cls._garantir_carregados()
+        orcamento = cls._limites.get((int(conta_id), int(categoria_id)))
+        if orcamento is None:
+            return None
+        limite, acao = orcamento
+
+        if not GastosMensais.construido:
+            GastosMensais.construir(Transacao.carregar_todas())
+        mes = GastosMensais.mes_de(data or datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        gasto = GastosMensais.total(conta_id, categoria_id, mes)
+        if gasto + valor <= limite:
+            return None
+
+        mensagem = (f"Orçamento da categoria excedido: R$ {gasto + valor:.2f} "
+                    f"de R$ {limite:.2f} em {mes}.")
+        if acao == 'bloquear':
+            raise ValueError(mensagem)
+        return mensagem
+
+    @classmethod
+    def limpar(cls) -> None:
+        """
+        Descarta os orçamentos em memória; eles serão recarregados na próxima verificação.
+        """
+        Orcamento._carregados = False
+        Orcamento._limites = {}
+
+    @classmethod
+    def _garantir_carregados(cls) -> None:
+        if cls._carregados:
+            return
+        df = cls.carregar_todas()
+        Orcamento._limites = {}
+        if not df.empty:
+            for conta_id, categoria_id, limite, acao in zip(
+                    df['conta_id'], df['categoria_id'], df['limite'], df['acao']):
+                Orcamento._limites[(int(conta_id), int(categoria_id))] = (float(limite), acao)
+        Orcamento._carregados = True
+
+    @classmethod
+    def _validar(cls, limite: float, acao: str) -> None:
+        if limite is None or limite <= 0:
+            raise ValueError("O limite do orçamento deve ser positivo.")
+        if acao not in cls.ACOES:
+            raise ValueError("Ação inválida. Deve ser 'avisar' ou 'bloquear'.")
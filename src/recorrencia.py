@@ -0,0 +1,244 @@
+# src/recorrencia.py
+import calendar
+import pandas as pd
+from datetime import date, datetime, timedelta
+from src.base_model import BaseModel
+from src.categoria import Categoria
+from src.transacao import Transacao
+
+
+class Recorrencia(BaseModel):
+    """
+    Classe responsável por representar e manipular regras de despesas
+    recorrentes (ex.: aluguel, assinaturas) de categorias do tipo 'fixa'.
+
+    Atributos:
+        DATA_PATH (str): Caminho para o arquivo Excel onde as regras são salvas.
+        id (int): Identificador único da regra.
+        conta_id (int): Identificador da conta onde as despesas serão lançadas.
+        categoria_id (int): Identificador da categoria (deve ser do tipo 'fixa').
+        valor (float): Valor de cada ocorrência.
+        descricao (str): Descrição usada nas transações geradas.
+        frequencia (str): 'mensal' ou 'semanal'.
+        dia (int): Dia do mês (1-31) para 'mensal', ou dia da semana
+            (0=segunda ... 6=domingo) para 'semanal'.
+        data_inicio (str): Data a partir da qual a regra vale ('AAAA-MM-DD').
+        ultima_execucao (str): Data da última ocorrência gerada ('' se nenhuma).
+
+    Parâmetros do construtor:
+        conta_id (int): ID da conta.
+        categoria_id (int): ID da categoria.
+        valor (float): Valor de cada ocorrência.
+        frequencia (str): 'mensal' ou 'semanal'.
+        dia (int, opcional): Dia da ocorrência. Se None, usa o dia de data_inicio.
+        descricao (str, opcional): Descrição das transações. Default é "".
+        data_inicio (str, opcional): Início da regra. Se None, usa a data atual.
+        ultima_execucao (str, opcional): Última ocorrência gerada.
+        id (int, opcional): Identificador único. Se None, será gerado automaticamente.
+
+    OBS: Nos meses com menos dias que `dia`, a ocorrência mensal cai no último dia do mês.
+    As transações geradas levam o ID da regra na coluna 'recorrencia_id'.
+    """
+
+    DATA_PATH = 'src/data/recorrencias.xlsx'
+    FREQUENCIAS = ['mensal', 'semanal']
+
+    def __init__(
+            self,
+            conta_id: int,
+            categoria_id: int,
+            valor: float,
+            frequencia: str,
+            dia: int = None,
+            descricao: str = "",
+            data_inicio: str = None,
+            ultima_execucao: str = "",
+            id: int = None
+    ):
+        self.id: int = id or self._generate_id()
+        self.conta_id: int = conta_id
+        self.categoria_id: int = categoria_id
+        self.valor: float = valor
+        self.frequencia: str = frequencia  # 'mensal' ou 'semanal'
+        self.descricao: str = descricao
+        self.data_inicio: str = data_inicio or datetime.now().strftime("%Y-%m-%d")
+        inicio = self._para_data(self.data_inicio)
+        if dia is None:
+            dia = inicio.day if frequencia == 'mensal' else inicio.weekday()
+        self.dia: int = int(dia)
+        self.ultima_execucao: str = ultima_execucao or ""
+
+    def salvar(self) -> None:
+        """
+        Salva a regra no arquivo Excel, criando-o se não existir.
+
+        Exceções:
+            ValueError: Se a frequência, o dia, o valor ou a categoria forem inválidos.
+        """
+        if self.frequencia not in self.FREQUENCIAS:
+            raise ValueError("Frequência inválida. Deve ser 'mensal' ou 'semanal'.")
+        if self.frequencia == 'mensal' and not 1 <= self.dia <= 31:
+            raise ValueError("Dia inválido. Deve estar entre 1 e 31.")
+        if self.frequencia == 'semanal' and not 0 <= self.dia <= 6:
+            raise ValueError("Dia da semana inválido. Deve estar entre 0 (segunda) e 6 (domingo).")
+        if self.valor <= 0:
+            raise ValueError("O valor da recorrência deve ser positivo.")
+        categoria = Categoria.buscar_por_id(self.categoria_id)
+        if not categoria or categoria.tipo != 'fixa':
+            raise ValueError("Recorrências só podem ser criadas para categorias do tipo 'fixa'.")
+
+        dados_anteriores = self._ler_arquivo()
+        nova_linha = {
+            'id': [self.id],
+            'conta_id': [self.conta_id],
+            'categoria_id': [self.categoria_id],
+            'valor': [self.valor],
+            'descricao': [self.descricao],
+            'frequencia': [self.frequencia],
+            'dia': [self.dia],
+            'data_inicio': [self.data_inicio],
+            'ultima_execucao': [self.ultima_execucao]
+        }
+        df_novo = pd.DataFrame(nova_linha)
+        df_final = pd.concat([dados_anteriores, df_novo], ignore_index=True)
+        self._gravar(df_final)
+
+    @classmethod
+    def buscar_por_conta(cls, conta_id: int) -> pd.DataFrame:
+        """
+        Busca e retorna todas as regras de recorrência de uma conta.
+        """
+        df = cls.carregar_todas()
+        if df.empty:
+            return df
+        return df[df['conta_id'] == conta_id]
+
+    def excluir(self) -> None:
+        """
+        Exclui a regra do arquivo Excel. As transações já geradas são mantidas.
+        """
+        df = self._ler_arquivo()
+        if not df.empty:
+            df = df[df['id'] != self.id]
+        self._gravar(df)
+
+    def ocorrencias_pendentes(self, ate: date, limite: int) -> list:
+        """
+        Retorna as datas das ocorrências ainda não geradas até a data `ate`,
+        em ordem cronológica e no máximo `limite` delas.
+        """
+        inicio = self._para_data(self.data_inicio)
+        if self.ultima_execucao:
+            inicio = max(inicio, self._para_data(self.ultima_execucao) + timedelta(days=1))
+
+        datas = []
+        if self.frequencia == 'semanal':
+            atual = inicio + timedelta(days=(self.dia - inicio.weekday()) % 7)
+            while atual <= ate and len(datas) < limite:
+                datas.append(atual)
+                atual += timedelta(days=7)
+        else:
+            ano, mes = inicio.year, inicio.month
+            while len(datas) < limite:
+                atual = date(ano, mes, min(self.dia, calendar.monthrange(ano, mes)[1]))
+                if atual > ate:
+                    break
+                if atual >= inicio:
+                    datas.append(atual)
+                ano, mes = (ano + 1, 1) if mes == 12 else (ano, mes + 1)
+        return datas
+
+    @classmethod
+    def materializar_pendentes(cls, ate: date = None, limite_por_regra: int = 24) -> int:
+        """
+        Gera, para todas as regras de todas as contas, as transações de 'saida'
+        que venceram até a data `ate`.
+
+        A execução é feita em lote: as ocorrências de todas as regras são
+        reunidas e gravadas com uma única reserva de IDs e uma única escrita no
+        arquivo de transações; depois as regras são regravadas de uma só vez
+        com a nova data de última execução.
+
+        É idempotente: ocorrências já presentes no histórico (mesma regra, pela
+        coluna 'recorrencia_id', e mesma data) não são duplicadas, mesmo que uma
+        execução anterior tenha sido interrompida entre as duas escritas. A
+        conferência considera apenas as linhas das regras vencidas a partir da
+        data pendente mais antiga.
+
+        O custo de recuperar um longo período sem execução é limitado por
+        `limite_por_regra`; as ocorrências restantes ficam para as próximas execuções.
+
+        OBS: Por serem custos fixos já assumidos, as despesas geradas não passam
+        pela verificação de saldo nem de orçamento.
+
+        Parâmetros:
+            ate (date, opcional): Data limite. Se None, usa a data atual.
+            limite_por_regra (int, opcional): Máximo de ocorrências por regra por execução.
+
+        Retorno:
+            int: Quantidade de transações geradas.
+        """
+        df_regras = cls._ler_arquivo()
+        if df_regras.empty:
+            return 0
+        ate = ate or date.today()
+
+        regras = [
+            cls(
+                id=r['id'],
+                conta_id=r['conta_id'],
+                categoria_id=r['categoria_id'],
+                valor=r['valor'],
+                frequencia=r['frequencia'],
+                dia=r['dia'],
+                descricao='' if pd.isna(r['descricao']) else r['descricao'],
+                data_inicio=str(r['data_inicio'])[:10],
+                ultima_execucao='' if pd.isna(r['ultima_execucao']) else str(r['ultima_execucao'])[:10]
+            )
+            for _, r in df_regras.iterrows()
+        ]
+
+        linhas = []
+        ultimas = {}
+        mais_antiga = None
+        for regra in regras:
+            datas = regra.ocorrencias_pendentes(ate, limite_por_regra)
+            if not datas:
+                continue
+            ultimas[int(regra.id)] = datas[-1].strftime("%Y-%m-%d")
+            mais_antiga = min(mais_antiga or datas[0], datas[0])
+            for d in datas:
+                linhas.append({
+                    'recorrencia_id': int(regra.id),
+                    'conta_id': regra.conta_id,
+                    'categoria_id': regra.categoria_id,
+                    'tipo': 'saida',
+                    'valor': regra.valor,
+                    'descricao': regra.descricao,
+                    'data': d.strftime("%Y-%m-%d 00:00:00")
+                })
+        if not linhas:
+            return 0
+
+        novas = pd.DataFrame(linhas)
+        df_transacoes = Transacao._ler_arquivo()
+        if not df_transacoes.empty and 'recorrencia_id' in df_transacoes.columns:
+            candidatas = df_transacoes[
+                df_transacoes['recorrencia_id'].isin(list(ultimas))
+                & (df_transacoes['data'].astype(str) >= mais_antiga.strftime("%Y-%m-%d"))
+            ]
+            existentes = set(zip(candidatas['recorrencia_id'].astype('int64'), candidatas['data'].astype(str)))
+            if existentes:
+                chaves = zip(novas['recorrencia_id'], novas['data'])
+                novas = novas[[chave not in existentes for chave in chaves]]
+        Transacao.salvar_lote(novas, dados_anteriores=df_transacoes)
+
+        df_regras['ultima_execucao'] = df_regras['ultima_execucao'].astype(object)
+        for regra_id, ultima in ultimas.items():
+            df_regras.loc[df_regras['id'] == regra_id, 'ultima_execucao'] = ultima
+        cls._gravar(df_regras)
+        return len(novas)
+
+    @staticmethod
+    def _para_data(valor) -> date:
+        return datetime.strptime(str(valor)[:10], "%Y-%m-%d").date()
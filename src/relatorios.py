@@ -0,0 +1,192 @@
+# src/relatorios.py
+"""
+Relatório geral (de todos os usuários): saldo de cada conta e total de
+despesas por categoria de cada usuário.
+
+O histórico é carregado uma única vez, convertido em arrays numpy e copiado
+para memória compartilhada (multiprocessing.shared_memory). As linhas são
+ordenadas por usuario_id e divididas em fatias que nunca separam um mesmo
+usuário; cada processo do pool recebe apenas o nome da memória compartilhada
+e os limites da sua fatia, sem cópia dos dados via pickle, e devolve os
+agregados parciais, que são concatenados ao final.
+
+Uso (a partir da raiz do projeto):
+    python -m src.relatorios [--processos N]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from src.conta import Conta
+from src.transacao import Transacao
+
+# Abaixo disso, o custo de subir o pool supera o ganho do paralelismo.
+MINIMO_PARA_PARALELIZAR = 50_000
+
+# Linhas dos arrays compartilhados
+_USUARIO, _CONTA, _CATEGORIA = 0, 1, 2
+_SALDO, _DESPESA = 0, 1
+
+
+def _agregar(inteiros: np.ndarray, reais: np.ndarray, inicio: int, fim: int):
+    """
+    Agrega uma fatia [inicio, fim) do histórico.
+
+    Retorno:
+        tuple: (saldos por usuário e conta, despesas por usuário e categoria).
+    """
+    fatia = pd.DataFrame({
+        'usuario_id': inteiros[_USUARIO, inicio:fim],
+        'conta_id': inteiros[_CONTA, inicio:fim],
+        'categoria_id': inteiros[_CATEGORIA, inicio:fim],
+        'saldo': reais[_SALDO, inicio:fim],
+        'total_despesas': reais[_DESPESA, inicio:fim],
+    })
+    saldos = fatia.groupby(['usuario_id', 'conta_id'], sort=False)['saldo'].sum().reset_index()
+    despesas = fatia[fatia['total_despesas'] > 0]
+    despesas = despesas.groupby(['usuario_id', 'categoria_id'], sort=False)['total_despesas'].sum().reset_index()
+    return saldos, despesas
+
+
+def _agregar_compartilhado(nome_inteiros: str, nome_reais: str, n: int, inicio: int, fim: int):
+    """
+    Executada nos processos do pool: acessa os arrays pela memória compartilhada.
+    """
+    shm_inteiros = shared_memory.SharedMemory(name=nome_inteiros)
+    shm_reais = shared_memory.SharedMemory(name=nome_reais)
+    try:
+        inteiros = np.ndarray((3, n), dtype=np.int64, buffer=shm_inteiros.buf)
+        reais = np.ndarray((2, n), dtype=np.float64, buffer=shm_reais.buf)
+        resultado = _agregar(inteiros, reais, inicio, fim)
+        del inteiros, reais
+        return resultado
+    finally:
+        shm_inteiros.close()
+        shm_reais.close()
+
+
+def _fatias(usuarios_ordenados: np.ndarray, quantidade: int) -> list:
+    """
+    Divide as linhas (ordenadas por usuário) em até `quantidade` fatias de
+    tamanho parecido, sem separar as linhas de um mesmo usuário.
+    """
+    n = len(usuarios_ordenados)
+    cortes = np.linspace(0, n, quantidade + 1).astype(np.int64)[1:-1]
+    cortes = np.searchsorted(usuarios_ordenados, usuarios_ordenados[cortes], side='left')
+    limites = sorted({0, n, *cortes.tolist()})
+    return list(zip(limites[:-1], limites[1:]))
+
+
+def _preparar_arrays(df_transacoes: pd.DataFrame, df_contas: pd.DataFrame):
+    """
+    Converte o histórico em dois arrays (inteiros e reais), ordenados por usuario_id.
+    Transações de contas inexistentes ficam com usuario_id = -1.
+    """
+    usuario_por_conta = pd.Series(
+        df_contas['usuario_id'].to_numpy(dtype=np.int64), index=df_contas['id'].to_numpy(dtype=np.int64)
+    )
+    conta_ids = df_transacoes['conta_id'].to_numpy(dtype=np.int64)
+    usuarios = usuario_por_conta.reindex(conta_ids).fillna(-1).to_numpy(dtype=np.int64)
+    valores = df_transacoes['valor'].to_numpy(dtype=np.float64)
+    tipos = df_transacoes['tipo'].to_numpy()
+    sinal = np.where(tipos == 'entrada', 1.0, np.where(tipos == 'saida', -1.0, 0.0))
+
+    ordem = np.argsort(usuarios, kind='stable')
+    inteiros = np.vstack([
+        usuarios[ordem],
+        conta_ids[ordem],
+        df_transacoes['categoria_id'].to_numpy(dtype=np.int64)[ordem],
+    ])
+    reais = np.vstack([
+        (valores * sinal)[ordem],
+        np.where(sinal < 0, valores, 0.0)[ordem],
+    ])
+    return inteiros, reais
+
+
+def gerar_relatorio_geral(processos: int = None):
+    """
+    Calcula o saldo de todas as contas e o total de despesas por categoria de
+    todos os usuários, distribuindo a agregação entre `processos` processos.
+
+    Parâmetros:
+        processos (int, opcional): Número de processos. Se None, usa os núcleos
+            disponíveis. Com 1 (ou históricos pequenos), agrega no próprio processo.
+
+    Retorno:
+        tuple: (saldos, despesas), onde
+            saldos (pd.DataFrame): colunas usuario_id, conta_id, saldo (todas as contas);
+            despesas (pd.DataFrame): colunas usuario_id, categoria_id, total_despesas.
+    """
+    processos = processos or os.cpu_count() or 1
+    df_contas = Conta.carregar_todas()
+    df_transacoes = Transacao.carregar_todas()
+    if df_contas.empty:
+        df_contas = pd.DataFrame({'id': pd.Series(dtype='int64'), 'usuario_id': pd.Series(dtype='int64')})
+    if df_transacoes.empty:
+        df_transacoes = pd.DataFrame({c: pd.Series(dtype='int64') for c in ['conta_id', 'categoria_id', 'valor']})
+        df_transacoes['tipo'] = pd.Series(dtype=object)
+
+    inteiros, reais = _preparar_arrays(df_transacoes, df_contas)
+    n = inteiros.shape[1]
+
+    if processos == 1 or n < MINIMO_PARA_PARALELIZAR:
+        parciais = [_agregar(inteiros, reais, 0, n)]
+    else:
+        shm_inteiros = shared_memory.SharedMemory(create=True, size=max(inteiros.nbytes, 1))
+        shm_reais = shared_memory.SharedMemory(create=True, size=max(reais.nbytes, 1))
+        try:
+            np.ndarray(inteiros.shape, dtype=np.int64, buffer=shm_inteiros.buf)[:] = inteiros
+            np.ndarray(reais.shape, dtype=np.float64, buffer=shm_reais.buf)[:] = reais
+            # Mais fatias que processos, para equilibrar usuários com históricos muito diferentes.
+            fatias = _fatias(inteiros[_USUARIO], processos * 4)
+            with ProcessPoolExecutor(max_workers=processos) as pool:
+                futuros = [
+                    pool.submit(_agregar_compartilhado, shm_inteiros.name, shm_reais.name, n, inicio, fim)
+                    for inicio, fim in fatias
+                ]
+                parciais = [f.result() for f in futuros]
+        finally:
+            shm_inteiros.close()
+            shm_inteiros.unlink()
+            shm_reais.close()
+            shm_reais.unlink()
+
+    # As fatias não compartilham usuários, então basta concatenar.
+    saldos = pd.concat([p[0] for p in parciais], ignore_index=True)
+    despesas = pd.concat([p[1] for p in parciais], ignore_index=True)
+
+    # Inclui as contas sem transações, com saldo zero.
+    todas_contas = pd.DataFrame({
+        'usuario_id': df_contas['usuario_id'].astype('int64'),
+        'conta_id': df_contas['id'].astype('int64'),
+    })
+    saldos = todas_contas.merge(saldos, on=['usuario_id', 'conta_id'], how='outer')
+    saldos['saldo'] = saldos['saldo'].fillna(0.0)
+    saldos = saldos.sort_values(['usuario_id', 'conta_id'], ignore_index=True)
+    despesas = despesas.sort_values(['usuario_id', 'categoria_id'], ignore_index=True)
+    return saldos, despesas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera o relatório geral de saldos e despesas.")
+    parser.add_argument('--processos', type=int, default=None,
+                        help="Número de processos (padrão: núcleos disponíveis).")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    saldos, despesas = gerar_relatorio_geral(args.processos)
+    decorrido = time.perf_counter() - inicio
+
+    print("=== SALDOS POR CONTA ===")
+    print(saldos.to_string(index=False))
+    print("\n=== DESPESAS POR CATEGORIA ===")
+    print(despesas.to_string(index=False))
+    print(f"\nRelatório gerado em {decorrido:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
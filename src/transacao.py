@@ -3,6 +3,10 @@ import pandas as pd
 import os
 from datetime import datetime
 from src.base_model import BaseModel
+from src.cache import em_cache
+from src.categoria import Categoria
+from src.indice_busca import IndiceBusca
+from src.gastos_mensais import GastosMensais
 
 class Transacao(BaseModel):
     """
@@ -56,7 +60,7 @@ class Transacao(BaseModel):
             None: Esta função não retorna valor.
         """
 
-        dados_anteriores = self.carregar_todas()
+        dados_anteriores = self._ler_arquivo()
         nova_linha = {
             'id': [self.id],
             'conta_id': [self.conta_id],
@@ -68,9 +72,45 @@ class Transacao(BaseModel):
         }
         df_novo = pd.DataFrame(nova_linha)
         df_final = pd.concat([dados_anteriores, df_novo], ignore_index=True)
-        df_final.to_excel(self.DATA_PATH, index=False)
+        self._gravar(df_final)
+        IndiceBusca.registrar_transacao(
+            self.id, self.conta_id, self.categoria_id, self.descricao, self.tipo, self.valor, self.data
+        )
+        GastosMensais.registrar(self.conta_id, self.categoria_id, self.tipo, self.valor, self.data)
 
     @classmethod
+    def salvar_lote(cls, novas: pd.DataFrame, dados_anteriores: pd.DataFrame = None) -> pd.DataFrame:
+        """
+        Salva várias transações de uma vez: uma leitura, uma reserva de bloco
+        de IDs e uma única escrita no arquivo Excel.
+
+        Parâmetros:
+            novas (pd.DataFrame): Transações a salvar, com as colunas conta_id,
+                categoria_id, tipo, valor, descricao e data (sem 'id'). Colunas
+                extras (ex.: recorrencia_id) também são gravadas.
+            dados_anteriores (pd.DataFrame, opcional): Histórico já carregado
+                pelo chamador, para evitar uma nova leitura do arquivo.
+
+        Retorno:
+            pd.DataFrame: As transações salvas, já com os IDs atribuídos.
+        """
+        if novas.empty:
+            return novas
+        if dados_anteriores is None:
+            dados_anteriores = cls._ler_arquivo()
+        novas = novas.copy()
+        novas.insert(0, 'id', list(cls._reservar_ids(len(novas), dados_anteriores)))
+        df_final = pd.concat([dados_anteriores, novas], ignore_index=True)
+        cls._gravar(df_final)
+        for _, row in novas.iterrows():
+            IndiceBusca.registrar_transacao(
+                row['id'], row['conta_id'], row['categoria_id'], row['descricao'], row['tipo'], row['valor'], row['data']
+            )
+            GastosMensais.registrar(row['conta_id'], row['categoria_id'], row['tipo'], row['valor'], row['data'])
+        return novas
+
+    @classmethod
+    @em_cache()
     def buscar_por_conta(cls, conta_id: int) -> pd.DataFrame:
         """
         Busca e retorna todas as transações relacionadas a uma conta específica.
@@ -85,6 +125,93 @@ class Transacao(BaseModel):
         transacoes = df[df['conta_id'] == conta_id]
         return transacoes
 
+    @classmethod
+    def buscar_por_conta_em_blocos(cls, conta_id: int, tamanho: int = None) -> pd.DataFrame:
+        """
+        Versão de buscar_por_conta() que percorre o arquivo em blocos: a memória
+        usada fica limitada ao tamanho do bloco mais as transações encontradas.
+
+        Parâmetros:
+            conta_id (int): ID da conta cujas transações serão buscadas.
+            tamanho (int, opcional): Linhas por bloco. Default é TAMANHO_BLOCO.
+
+        Retorno:
+            pd.DataFrame: DataFrame contendo todas as transações da conta informada.
+        """
+        partes = [bloco[bloco['conta_id'] == conta_id] for bloco in cls.iterar_em_blocos(tamanho)]
+        if not partes:
+            return pd.DataFrame()
+        return pd.concat(partes, ignore_index=True)
+
+    @classmethod
+    def saldo_em_blocos(cls, conta_id: int, tamanho: int = None) -> float:
+        """
+        Calcula o saldo de uma conta percorrendo o arquivo em blocos e somando
+        os saldos parciais de cada bloco.
+
+        Parâmetros:
+            conta_id (int): ID da conta.
+            tamanho (int, opcional): Linhas por bloco. Default é TAMANHO_BLOCO.
+
+        Retorno:
+            float: Soma das entradas menos a soma das saídas da conta.
+        """
+        saldo = 0.0
+        for bloco in cls.iterar_em_blocos(tamanho):
+            bloco = bloco[bloco['conta_id'] == conta_id]
+            entradas = bloco[bloco['tipo'] == 'entrada']['valor'].sum()
+            saidas = bloco[bloco['tipo'] == 'saida']['valor'].sum()
+            saldo += float(entradas - saidas)
+        return saldo
+
+    @classmethod
+    def totais_por_categoria_em_blocos(cls, conta_ids=None, tamanho: int = None) -> pd.DataFrame:
+        """
+        Soma as entradas e as saídas por categoria, percorrendo o arquivo em
+        blocos e acumulando os totais parciais de cada bloco.
+
+        Parâmetros:
+            conta_ids (iterável, opcional): Restringe a soma a estas contas.
+                Se None, considera todas as contas.
+            tamanho (int, opcional): Linhas por bloco. Default é TAMANHO_BLOCO.
+
+        Retorno:
+            pd.DataFrame: Indexado por categoria_id, com as colunas 'entrada' e 'saida'.
+        """
+        contas = None if conta_ids is None else {int(c) for c in conta_ids}
+        totais = pd.DataFrame(columns=['entrada', 'saida'], dtype='float64')
+        for bloco in cls.iterar_em_blocos(tamanho):
+            if contas is not None:
+                bloco = bloco[bloco['conta_id'].isin(contas)]
+            parcial = bloco.pivot_table(
+                index='categoria_id', columns='tipo', values='valor', aggfunc='sum', fill_value=0.0
+            )
+            parcial = parcial.reindex(columns=['entrada', 'saida'], fill_value=0.0).astype('float64')
+            totais = totais.add(parcial, fill_value=0.0)
+        totais.index.name = 'categoria_id'
+        return totais
+
+    @classmethod
+    def buscar_por_texto(cls, consulta: str, conta_ids) -> pd.DataFrame:
+        """
+        Busca transações pela descrição ou pelo nome da categoria, usando o
+        índice invertido (sem diferenciar maiúsculas nem acentos).
+
+        Cada palavra da consulta é tratada como prefixo e todas precisam
+        aparecer na transação (ex.: "merc jan" encontra "Compra de mercado de janeiro").
+
+        Parâmetros:
+            consulta (str): Texto a ser buscado.
+            conta_ids (iterável): IDs das contas às quais a busca se restringe.
+
+        Retorno:
+            pd.DataFrame: DataFrame com as transações encontradas, montado a
+            partir dos campos guardados no próprio índice (sem reler o histórico).
+        """
+        if not IndiceBusca.construido:
+            IndiceBusca.construir(cls.carregar_todas(), Categoria.carregar_todas())
+        return IndiceBusca.linhas(IndiceBusca.buscar(consulta, conta_ids))
+
     def editar(
         self,
         categoria_id: int = None,
@@ -109,11 +236,12 @@ class Transacao(BaseModel):
         Exceções:
             ValueError: Se a transação não for encontrada ou se o tipo for inválido.
         """
-        df = self.carregar_todas()
+        df = self._ler_arquivo()
         index = df.index[df['id'] == self.id].tolist()
         if not index:
             raise ValueError("Transação não encontrada.")
         index = index[0]
+        anterior = df.loc[index]
         if category_id := categoria_id or None:   # Will do a quick check in code
             df.at[index, 'categoria_id'] = category_id
             self.categoria_id = category_id
@@ -131,7 +259,14 @@ class Transacao(BaseModel):
         if data is not None:
             df.at[index, 'data'] = data
             self.data = data
-        df.to_excel(self.DATA_PATH, index=False)
+        self._gravar(df)
+        IndiceBusca.registrar_transacao(
+            self.id, self.conta_id, self.categoria_id, self.descricao, self.tipo, self.valor, self.data
+        )
+        GastosMensais.registrar(
+            anterior['conta_id'], anterior['categoria_id'], anterior['tipo'], anterior['valor'], anterior['data'], sinal=-1
+        )
+        GastosMensais.registrar(self.conta_id, self.categoria_id, self.tipo, self.valor, self.data)
 
     def excluir(self) -> None:
         """
@@ -140,6 +275,10 @@ class Transacao(BaseModel):
         Retorno:
             None: Esta função não retorna valor.
         """
-        df = self.carregar_todas()
+        df = self._ler_arquivo()
+        removidas = df[df['id'] == self.id]
         df = df[df['id'] != self.id]
-        df.to_excel(self.DATA_PATH, index=False)
+        self._gravar(df)
+        IndiceBusca.remover_transacao(self.id)
+        for _, row in removidas.iterrows():
+            GastosMensais.registrar(row['conta_id'], row['categoria_id'], row['tipo'], row['valor'], row['data'], sinal=-1)
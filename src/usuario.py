@@ -41,7 +41,7 @@ class Usuario(BaseModel):
             None: Esta função não retorna valor.
         """
 
-        dados_anteriores = self.carregar_todas()
+        dados_anteriores = self._ler_arquivo()
         nova_linha = {
             'id': [self.id],
             'nome': [self.nome],
@@ -51,7 +51,7 @@ class Usuario(BaseModel):
         }
         df_novo = pd.DataFrame(nova_linha)
         df_final = pd.concat([dados_anteriores, df_novo], ignore_index=True)
-        df_final.to_excel(self.DATA_PATH, index=False)
+        self._gravar(df_final)
 
     @classmethod
     def buscar_por_email(cls, email: str):
@@ -92,7 +92,7 @@ class Usuario(BaseModel):
         Exceções:
             ValueError: Se o usuário não for encontrado no arquivo de dados.
         """
-        df = self.carregar_todas()
+        df = self._ler_arquivo()
         index = df.index[df['id'] == self.id].tolist()
         if not index:
             raise ValueError("Usuário não encontrado.")
@@ -106,7 +106,7 @@ class Usuario(BaseModel):
         if senha:
             df.at[index, 'senha'] = senha
             self.senha = senha
-        df.to_excel(self.DATA_PATH, index=False)
+        self._gravar(df)
 
     def autenticar(self, senha: str) -> bool:
         """